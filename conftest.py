@@ -0,0 +1,18 @@
+import os
+import shutil
+import sys
+import tempfile
+import pytest
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Put tmp_path directories on tmpfs when available; venv creation writes hundreds of small files."""
+    # Lives at the rootdir so it runs before pytest sets up tmp_path_factory
+    if config.option.basetemp or sys.platform != 'linux' or hasattr(config, 'workerinput'):
+        # An explicit --basetemp wins, and xdist workers inherit theirs from the controller
+        return
+    if not (os.path.ismount('/dev/shm') and os.access('/dev/shm', os.W_OK)):
+        return
+    basetemp = tempfile.mkdtemp(prefix='pytest-', dir='/dev/shm')
+    config.option.basetemp = basetemp
+    config.add_cleanup(lambda: shutil.rmtree(basetemp, ignore_errors=True))
@@ -0,0 +1,46 @@
+# Manual smoke test for dependency_core: scans, installs into and generates requirements for
+# a throwaway project in ./test_project_for_core. Run with: python _selftest.py
+
+import os
+import sys
+
+from dependency_core import (
+    scan_dependencies_logic,
+    install_dependencies_logic,
+    generate_requirements_logic,
+    dependency_tree_logic,
+)
+
+if __name__ == "__main__":
+    print("--- Testing dependency_core.py directly ---")
+    test_folder = os.path.join(os.getcwd(), "test_project_for_core")
+    python_exe = sys.executable
+
+    print(f"Scanning current directory: {test_folder} with Python: {python_exe}")
+
+    if not os.path.exists(test_folder):
+        os.makedirs(test_folder)
+    with open(os.path.join(test_folder, "script.py"), "w") as f:
+        f.write("import requests\nfrom bs4 import BeautifulSoup\nimport numpy\nimport os\n")
+    with open(os.path.join(test_folder, "requirements.txt"), "w") as f:
+        f.write("pandas\nscipy\n")
+
+    missing, scan_output = scan_dependencies_logic(test_folder, python_exe, recursive=True)
+    for msg in scan_output:
+        print(msg)
+
+    if missing:
+        print("\nAttempting to install missing dependencies...")
+        success, failed, install_output = install_dependencies_logic(missing, python_exe, verbose=True)
+        for msg in install_output:
+            print(msg)
+
+    print("\nGenerating requirements.txt...")
+    success, gen_output = generate_requirements_logic(test_folder, python_exe)
+    for msg in gen_output:
+        print(msg)
+
+    print("\nGenerating dependency tree...")
+    success, tree_output = dependency_tree_logic(python_exe, output_format="text")
+    for msg in tree_output:
+        print(msg)
@@ -1,17 +1,21 @@
 # version 1.7
 
 import argparse
+import functools
+import hashlib
+import io
+import json
 import os
+import shutil
+import stat
 import sys
+import time
 import logging
-import venv
-import subprocess
-from typing import List, Dict, Tuple
-from dependency_core import (
-    scan_dependencies_logic, install_dependencies_logic, list_installed_packages,
-    upgrade_package, install_package, check_dependencies, get_python_info,
-    generate_requirements_logic, dependency_tree_logic, load_package_map
-)
+import warnings
+from typing import Any, Callable, List, Dict, Optional, Tuple
+
+# dependency_core and other heavy modules are imported inside the functions and
+# command branches that need them, so '--help' and light commands start quickly.
 
 # Configure logging
 logging.basicConfig(
@@ -21,111 +25,313 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_WIN = sys.platform == 'win32'
+# Nuitka defines __compiled__ in compiled modules. sys.executable is then the dep-check
+# binary itself, which can neither run pip nor be inspected in-process.
+_COMPILED = "__compiled__" in globals()
+_BIN_DIR = 'Scripts' if _WIN else 'bin'
+_PY_EXE = 'python.exe' if _WIN else 'python'
+
+_TREE_FORMATS = ("text", "json", "json-tree", "dot", "pdf", "png", "svg")
+
+# Cached interpreter details are refreshed at least once a day even if the executable is unchanged
+_PYTHON_INFO_TTL = 24 * 60 * 60
+
+# Part of every scan fingerprint; bump it when scan output changes without a change to
+# the tool's own files (those are fingerprinted too, see _tool_fingerprint)
+_SCAN_CACHE_VERSION = 1
+
+def _cache_dir() -> str:
+    """Return the per-user cache directory for dependency checker results."""
+    try:
+        from platformdirs import user_cache_dir
+        return user_cache_dir("dependency_checker")
+    except ImportError:
+        if _WIN:
+            base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+        else:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(base, 'dependency_checker')
+
+def _cache_path(name: str, identity: str) -> str:
+    digest = hashlib.sha256(identity.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(_cache_dir(), f"{name}-{digest}.json")
+
+def _cached(name: str, key: List, ttl: Optional[float], fn: Callable[[], Any], refresh: bool = False) -> Any:
+    """
+    Return fn() memoized on disk. The entry is stored per (name, key[0]) and is
+    invalidated when the rest of the key changes or when it is older than ttl seconds.
+    If refresh=True, the stored entry is ignored and overwritten.
+    """
+    path = _cache_path(name, str(key[0]))
+    if not refresh:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if entry['key'] == key and (ttl is None or time.time() - entry['time'] < ttl):
+                return entry['value']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    value = fn()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'time': time.time(), 'value': value}, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Could not write cache entry %s: %s", path, e)
+    return value
+
+def _load_python_info(python_exe: str, use_cache: bool = True) -> Dict[str, Any]:
+    """Get interpreter details, reusing the on-disk cache while the executable is unchanged."""
+    from dependency_core import _register_standard_library_modules, get_python_info
+    if python_exe == sys.executable:
+        # Answered in-process by get_python_info, cheaper than reading the cache
+        return get_python_info(python_exe)
+    exe_path = os.path.abspath(shutil.which(python_exe) or python_exe)
+    try:
+        mtime_ns = os.stat(exe_path).st_mtime_ns
+    except OSError:
+        use_cache = False
+    if not use_cache:
+        return get_python_info(python_exe)
+    info = _cached("python_info", [exe_path, mtime_ns], _PYTHON_INFO_TTL, lambda: get_python_info(python_exe))
+    if 'site_dirs' not in info:
+        # Written by an older version that didn't record the site directories
+        info = _cached("python_info", [exe_path, mtime_ns], _PYTHON_INFO_TTL, lambda: get_python_info(python_exe), refresh=True)
+    # A cache hit skips get_python_info, so hand the probed stdlib names to the core here
+    _register_standard_library_modules(info['version'], info.get('stdlib_modules', []))
+    if info.get('environment') == 'unknown':
+        # Never keep a failed probe around; retry on the next invocation
+        try:
+            os.remove(_cache_path("python_info", exe_path))
+        except OSError:
+            pass
+    return info
+
+def _load_package_map(file_path: Optional[str]) -> Dict[str, str]:
+    """Load the package map, logging any problem with the custom map file as a warning."""
+    from dependency_core import load_package_map
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        package_map = load_package_map(file_path)
+    for warning in caught:
+        logger.warning("%s", warning.message)
+    return package_map
+
+def _tool_fingerprint() -> str:
+    """
+    Identify the installed tool: the cache version, plus the mtime and size of its modules
+    and bundled data (standard library lists), which change whenever it is upgraded.
+    """
+    import dependency_core
+    core_dir = os.path.dirname(os.path.abspath(dependency_core.__file__))
+    paths = [os.path.abspath(__file__), os.path.abspath(dependency_core.__file__)]
+    try:
+        paths.extend(sorted(entry.path for entry in os.scandir(os.path.join(core_dir, 'data'))))
+    except OSError:
+        pass
+    parts = [f"v{_SCAN_CACHE_VERSION}"]
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        parts.append(f"{path}:{st.st_mtime_ns}:{st.st_size}")
+    return "\n".join(parts)
+
+def _scan_fingerprint(path: str, recursive: bool, python_exe: str, package_name_map: Dict[str, str], use_cache: bool = True) -> Optional[str]:
+    """
+    Fingerprint everything a scan result depends on: the tool itself, the project files and
+    directory names, the interpreter, its site-packages (changed by every install) and the
+    package map.
+    Directories the scan doesn't descend into are skipped here too.
+    Returns None if the interpreter couldn't be probed, as its installs then can't be tracked.
+    """
+    from dependency_core import _SKIP_DIRS
+    python_info = _load_python_info(python_exe, use_cache=use_cache)
+    if python_info['environment'] == 'unknown':
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_tool_fingerprint().encode('utf-8', 'surrogateescape') + b'\0')
+    pending = [path]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            digest.update(entry.path.encode('utf-8', 'surrogateescape') + b'\0')
+            if entry.is_dir(follow_symlinks=False):
+                if recursive and entry.name not in _SKIP_DIRS and not entry.name.startswith('.'):
+                    pending.append(entry.path)
+            elif entry.name.endswith('.py') or entry.name == 'requirements.txt':
+                st = entry.stat()
+                digest.update(f"{st.st_mtime_ns}:{st.st_size}\n".encode())
+
+    digest.update(f"{os.path.abspath(python_exe)}\0{python_info['version']}\0{python_info['prefix']}\n".encode())
+    for site_dir in python_info['site_dirs']:
+        try:
+            digest.update(f"{site_dir}:{os.stat(site_dir).st_mtime_ns}\n".encode())
+        except OSError:
+            pass
+    digest.update(json.dumps(sorted(package_name_map.items())).encode())
+    return digest.hexdigest()
+
+def _scan_with_cache(args: argparse.Namespace, python_exe: str, python_version: str, package_name_map: Dict[str, str]) -> Tuple[Dict[str, str], List[str]]:
+    """Run scan_dependencies_logic, reusing the result of a previous scan of an unchanged project."""
+    from dependency_core import scan_dependencies_logic
+
+    def scan() -> Tuple[Dict[str, str], List[str]]:
+        return scan_dependencies_logic(args.path, python_exe, recursive=args.recursive, python_version=python_version, package_name_map=package_name_map, jobs=args.jobs, use_io_uring=args.io_uring)
+
+    if args.no_cache:
+        return scan()
+    fingerprint = _scan_fingerprint(args.path, args.recursive, python_exe, package_name_map)
+    if fingerprint is None:
+        return scan()
+    identity = f"{os.path.abspath(args.path)}|{python_exe}|{args.recursive}"
+    missing_deps, messages = _cached("scan", [identity, fingerprint], None, scan, refresh=args.refresh)
+    return missing_deps, messages
+
+def _print_messages(messages: List[str]) -> None:
+    """Write all messages to stdout in a single write and flush."""
+    if messages:
+        sys.stdout.write("\n".join(messages) + "\n")
+        sys.stdout.flush()
+
+def _print_json(data: Any) -> None:
+    """Write data to stdout as JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        sys.stdout.write(json.dumps(data) + "\n")
+    else:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data) + b"\n")
+    sys.stdout.flush()
+
+def _is_dir(path: str) -> bool:
+    """Check whether path is a directory with a single stat call."""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+def _run_streamed(cmd: List[str]) -> None:
+    """Run a command, forwarding its output to the logger line by line. Raises on a non-zero exit."""
+    import subprocess
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1, text=True, encoding='utf-8', errors='ignore')
+    for line in process.stdout:
+        logger.info(line.rstrip())
+    returncode = process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
 def create_venv_if_needed(path: str, python_exe: str) -> Tuple[bool, str]:
     """Create a virtual environment in the specified path if none exists."""
+    import venv
     venv_path = os.path.join(path, '.venv')
-    if os.path.exists(venv_path):
-        logger.info(f"Virtual environment already exists at {venv_path}")
-        return True, os.path.join(venv_path, 'Scripts' if sys.platform == 'win32' else 'bin', 'python')
+    new_python_exe = os.path.join(venv_path, _BIN_DIR, _PY_EXE)
+    if _is_dir(venv_path):
+        logger.info("Virtual environment already exists at %s", venv_path)
+        return True, new_python_exe
     
+    # Set DEPCHECK_SKIP_PIP_UPGRADE=1 to keep the bundled pip (offline use, tests)
+    upgrade_pip = not os.environ.get('DEPCHECK_SKIP_PIP_UPGRADE')
     try:
-        logger.info(f"Creating virtual environment at {venv_path}")
-        venv.create(venv_path, with_pip=True)
-        new_python_exe = os.path.join(venv_path, 'Scripts' if sys.platform == 'win32' else 'bin', 'python')
-        # Upgrade pip in the new virtual environment
-        subprocess.run([new_python_exe, '-m', 'pip', 'install', '--upgrade', 'pip'], check=True)
+        logger.info("Creating virtual environment at %s", venv_path)
+        if sys.version_info >= (3, 9):
+            # EnvBuilder upgrades pip as part of creation, no separate pip run needed
+            venv.EnvBuilder(with_pip=True, upgrade_deps=upgrade_pip).create(venv_path)
+        else:
+            venv.create(venv_path, with_pip=True)
+            if upgrade_pip:
+                # Upgrade pip in the new virtual environment
+                _run_streamed([new_python_exe, '-m', 'pip', 'install', '--upgrade', 'pip'])
         return True, new_python_exe
     except Exception as e:
-        logger.error(f"Failed to create virtual environment: {e}")
+        logger.error("Failed to create virtual environment: %s", e)
         return False, python_exe
 
+def _parse_selection(choice: str, count: int) -> List[int]:
+    """Parse a selection like '1,3,5' or '2-4' into sorted zero-based indexes, ignoring invalid entries."""
+    selected = set()
+    for token in choice.replace(',', ' ').split():
+        first, _, last = token.partition('-')
+        if not first.isdigit() or (last and not last.isdigit()):
+            continue
+        selected.update(i - 1 for i in range(int(first), int(last or first) + 1) if 1 <= i <= count)
+    return sorted(selected)
+
 def prompt_for_installation(missing_deps: Dict[str, str], package_name_map: Dict[str, str]) -> List[str]:
     """Prompt user to select which dependencies to install."""
-    selected_packages = []
+    packages = list(missing_deps)
+    display_names = [package_name_map.get(pkg.lower(), pkg) for pkg in packages]
     print("\nMissing dependencies found:")
-    for pkg, src in missing_deps.items():
-        display_name = package_name_map.get(pkg.lower(), pkg)
-        print(f"- {display_name} (from {src})")
-    print("\nWould you like to install these dependencies? (all/individual/none)")
-    choice = input("Enter choice [all/individual/none]: ").strip().lower()
+    for number, (display_name, src) in enumerate(zip(display_names, missing_deps.values()), start=1):
+        print(f"  {number}. {display_name} (from {src})")
+    print("\nWhich dependencies would you like to install? (all/individual/none, or numbers such as 1,3,5)")
+    choice = input("Enter choice [all/individual/none/numbers]: ").strip().lower()
     
-    if choice == 'all':
-        return list(missing_deps.keys())
-    elif choice == 'individual':
-        for pkg in missing_deps:
-            display_name = package_name_map.get(pkg.lower(), pkg)
-            response = input(f"Install {display_name}? [y/n]: ").strip().lower()
-            if response == 'y':
-                selected_packages.append(pkg)
-        return selected_packages
+    if choice in ('all', 'a'):
+        return packages
+    elif choice in ('individual', 'i'):
+        return [
+            pkg for pkg, display_name in zip(packages, display_names)
+            if input(f"Install {display_name}? [y/n]: ").strip().lower() == 'y'
+        ]
     else:
-        return []
+        return [packages[i] for i in _parse_selection(choice, len(packages))]
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Python Dependency Manager: Scans, installs, and manages dependencies for Python projects.\n"
-                    "Usage: python dependency_cli.py [path] <command> [options]",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    parser.add_argument(
-        "path",
-        type=str,
-        nargs="?",
-        default=".",
-        help="Path to the project folder (default: current directory).\n"
-             "Use quotes for paths with spaces, e.g., \"C:/My Project\"."
-    )
-    parser.add_argument(
-        "-r", "--recursive",
+def _add_refresh_argument(command_parser: argparse.ArgumentParser) -> None:
+    command_parser.add_argument(
+        "--refresh",
         action="store_true",
-        help="Scan subdirectories recursively (for scan, install, generate-requirements)."
-    )
-    parser.add_argument(
-        "-v", "--verbose",
-        action="store_true",
-        help="Enable verbose output for installation process (for install)."
-    )
-    parser.add_argument(
-        "--python",
-        type=str,
-        default=sys.executable,
-        help="Python interpreter to use (e.g., 'python3.8' or 'C:\\Python38\\python.exe').\n"
-             "Default: current Python executable."
-    )
-    parser.add_argument(
-        "--create-venv",
-        action="store_true",
-        help="Create a virtual environment if none exists in the project folder (for install, generate-requirements)."
-    )
-    parser.add_argument(
-        "--package-map",
-        type=str,
-        help="Path to a JSON file with custom import-to-PyPI package mappings."
+        help="Rescan the project even if a cached result for the unchanged project exists."
     )
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands", required=True)
+def _build_scan(subparsers) -> None:
+    scan_parser = subparsers.add_parser("scan", help="Scan the specified folder for missing dependencies.")
+    _add_refresh_argument(scan_parser)
 
-    subparsers.add_parser("scan", help="Scan the specified folder for missing dependencies.")
-    
+def _build_install(subparsers) -> None:
     install_parser = subparsers.add_parser("install", help="Install missing dependencies found in the specified folder.")
     install_parser.add_argument(
         "--interactive",
         action="store_true",
         help="Prompt for each dependency before installing."
     )
+    install_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help="Maximum number of packages passed to a single pip invocation (default: 0, all at once).\n"
+             "Batches run one after another."
+    )
+    _add_refresh_argument(install_parser)
 
+def _build_list(subparsers) -> None:
     list_parser = subparsers.add_parser("list", help="List installed packages in the current environment.")
     list_parser.add_argument("--outdated", action="store_true", help="Show only outdated packages.")
+    list_parser.add_argument("--json", action="store_true", help="Print the package list as a JSON array.")
 
+def _build_upgrade(subparsers) -> None:
     upgrade_parser = subparsers.add_parser("upgrade", help="Upgrade a package to the latest version.")
     upgrade_parser.add_argument("package", help="Package to upgrade (e.g., 'requests' or 'bs4').")
 
+def _build_install_pkg(subparsers) -> None:
     install_pkg_parser = subparsers.add_parser("install-pkg", help="Install a package, optionally with a specific version.")
     install_pkg_parser.add_argument("package", help="Package to install (e.g., 'requests' or 'bs4').")
     install_pkg_parser.add_argument("--version", help="Specific version to install (e.g., '2.28.1').")
 
+def _build_check(subparsers) -> None:
     subparsers.add_parser("check", help="Check for broken dependencies in the current environment.")
 
+def _build_generate_requirements(subparsers) -> None:
     generate_parser = subparsers.add_parser("generate-requirements", help="Generate a requirements.txt file from imports.")
     generate_parser.add_argument(
         "--output-file",
@@ -133,10 +339,11 @@ def main():
         help="Output file name for requirements.txt (default: requirements.txt)."
     )
 
+def _build_tree(subparsers) -> None:
     tree_parser = subparsers.add_parser("tree", help="Display dependency tree using pipdeptree.")
     tree_parser.add_argument(
         "--format",
-        choices=["text", "json", "json-tree", "dot", "pdf", "png", "svg"],
+        choices=_TREE_FORMATS,
         default="text",
         help="Output format for dependency tree (default: text). Graph formats require GraphViz."
     )
@@ -150,15 +357,162 @@ def main():
         help="Show reverse dependency tree (packages that depend on the specified package)."
     )
 
-    args = parser.parse_args()
+# Command name -> function adding that command's subparser, in the order shown by --help
+_SUBPARSER_BUILDERS = {
+    "scan": _build_scan,
+    "install": _build_install,
+    "list": _build_list,
+    "upgrade": _build_upgrade,
+    "install-pkg": _build_install_pkg,
+    "check": _build_check,
+    "generate-requirements": _build_generate_requirements,
+    "tree": _build_tree,
+}
 
+def _peek_command(argv: List[str]) -> Optional[str]:
+    """
+    Find the command token in argv without parsing it.
+    Returns None when it is missing or ambiguous, or when top-level help is requested.
+    """
+    candidates = [i for i, token in enumerate(argv) if token in _SUBPARSER_BUILDERS]
+    if len(candidates) != 1:
+        return None
+    index = candidates[0]
+    if any(token in ("-h", "--help") for token in argv[:index]):
+        return None
+    return argv[index]
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser. If command is given, only that command's subparser is
+    registered; otherwise all of them are (needed for top-level help and error messages).
+    Parsers are cached so repeated main() calls in one process reuse them.
+    """
+    parser = argparse.ArgumentParser(
+        description="Python Dependency Manager: Scans, installs, and manages dependencies for Python projects.\n"
+                    "Usage: python dependency_cli.py [path] <command> [options]",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "path",
+        type=str,
+        nargs="?",
+        default=".",
+        help="Path to the project folder (default: current directory).\n"
+             "Use quotes for paths with spaces, e.g., \"C:/My Project\"."
+    )
+    parser.add_argument(
+        "-r", "--recursive",
+        action="store_true",
+        help="Scan subdirectories recursively (for scan, install, generate-requirements)."
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Enable verbose output for installation process (for install)."
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Suppress informational log lines; command results and warnings are still shown."
+    )
+    parser.add_argument(
+        "--python",
+        type=str,
+        default=None if _COMPILED else sys.executable,
+        help="Python interpreter to use (e.g., 'python3.8' or 'C:\\Python38\\python.exe').\n"
+             "Default: current Python executable; required for the standalone binary."
+    )
+    parser.add_argument(
+        "--create-venv",
+        action="store_true",
+        help="Create a virtual environment if none exists in the project folder (for install, generate-requirements)."
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of import-parsing processes for scan, install, generate-requirements.\n"
+             "Default: the CPU count."
+    )
+    parser.add_argument(
+        "--io-uring",
+        action="store_true",
+        help="Read source files in batches through io_uring (Linux only, requires the 'liburing' package).\n"
+             "Falls back to regular reads when unavailable (for scan, install, generate-requirements)."
+    )
+    parser.add_argument(
+        "--package-map",
+        type=str,
+        help="Path to a JSON file with custom import-to-PyPI package mappings."
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached interpreter details and scan results from previous runs."
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands", required=True)
+    if command is not None:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for build_subparser in _SUBPARSER_BUILDERS.values():
+            build_subparser(subparsers)
+    return parser
+
+def _parse_args(argv: List[str]) -> Tuple[argparse.ArgumentParser, argparse.Namespace]:
+    """
+    Parse argv with a parser holding only the command found by _peek_command. If that
+    fails, parse again with the full parser, so usage errors list every command.
+    """
+    command = _peek_command(argv)
+    if command is not None:
+        parser = _build_parser(command)
+        saved_stderr, sys.stderr = sys.stderr, io.StringIO()
+        try:
+            return parser, parser.parse_args(argv)
+        except SystemExit as e:
+            if not e.code:
+                # --help for the command; it has already been printed
+                raise
+        finally:
+            sys.stderr = saved_stderr
+    parser = _build_parser(None)
+    return parser, parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    parser, args = _parse_args(sys.argv[1:] if argv is None else argv)
+    if args.python is None:
+        parser.error("--python is required when running the standalone dep-check binary")
+    # Only this module's logger, and reset on every call, so repeated main() calls and
+    # embedding applications keep their own logging configuration
+    logger.setLevel(logging.WARNING if args.quiet else logging.NOTSET)
+    json_output = getattr(args, 'json', False)
+    # Keep stdout for the JSON document alone, so it can be piped. The streams are put
+    # back afterwards, so a later run in the same process logs to stdout again.
+    handlers = [
+        handler for handler in (logging.getLogger().handlers if json_output else [])
+        if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler)
+    ]
+    saved_streams = [handler.setStream(sys.stderr) for handler in handlers]
+    try:
+        _run_command(args, json_output)
+    finally:
+        for handler, stream in zip(handlers, saved_streams):
+            if stream is not None:
+                handler.setStream(stream)
+
+def _run_command(args: argparse.Namespace, json_output: bool) -> None:
+    """Run the command selected in args. Every command ends by calling sys.exit."""
     # Load package mappings
-    package_name_map = load_package_map(args.package_map)
+    package_name_map = _load_package_map(args.package_map)
 
-    python_info = get_python_info(args.python)
-    logger.info(f"Python Version: {python_info['version']}")
-    logger.info(f"Environment: {python_info['environment']} ({python_info['prefix']})")
-    print()
+    python_info = _load_python_info(args.python, use_cache=not args.no_cache)
+    logger.info("Python Version: %s", python_info['version'])
+    logger.info("Environment: %s (%s)", python_info['environment'], python_info['prefix'])
+    if logger.isEnabledFor(logging.INFO) and not json_output:
+        print()
 
     # Handle virtual environment creation
     python_exe = args.python
@@ -166,19 +520,18 @@ def main():
         success, new_python_exe = create_venv_if_needed(args.path, args.python)
         if success:
             python_exe = new_python_exe
-            logger.info(f"Using Python executable from virtual environment: {python_exe}")
+            logger.info("Using Python executable from virtual environment: %s", python_exe)
         else:
             logger.error("Continuing with original Python executable due to virtual environment creation failure.")
 
-    if args.command in ["scan", "install", "generate-requirements"] and not os.path.isdir(args.path):
-        logger.error(f"'{args.path}' is not a valid directory.")
+    if args.command in ["scan", "install", "generate-requirements"] and not _is_dir(args.path):
+        logger.error("'%s' is not a valid directory.", args.path)
         sys.exit(1)
 
     if args.command == "scan":
-        logger.info(f"Scanning dependencies in '{args.path}'...")
-        missing_deps, messages = scan_dependencies_logic(args.path, python_exe, recursive=args.recursive, python_version=python_info['version'], package_name_map=package_name_map)
-        for msg in messages:
-            print(msg)
+        logger.info("Scanning dependencies in '%s'...", args.path)
+        missing_deps, messages = _scan_with_cache(args, python_exe, python_info['version'], package_name_map)
+        _print_messages(messages)
         if not missing_deps:
             logger.info("No missing dependencies found.")
             sys.exit(0)
@@ -186,10 +539,10 @@ def main():
         sys.exit(1)
 
     elif args.command == "install":
-        logger.info(f"Scanning dependencies in '{args.path}'...")
-        missing_deps, messages = scan_dependencies_logic(args.path, python_exe, recursive=args.recursive, python_version=python_info['version'], package_name_map=package_name_map)
-        for msg in messages:
-            print(msg)
+        from dependency_core import install_dependencies_logic
+        logger.info("Scanning dependencies in '%s'...", args.path)
+        missing_deps, messages = _scan_with_cache(args, python_exe, python_info['version'], package_name_map)
+        _print_messages(messages)
         if not missing_deps:
             logger.info("No missing dependencies found.")
             sys.exit(0)
@@ -203,53 +556,68 @@ def main():
             missing_deps = {pkg: missing_deps[pkg] for pkg in packages_to_install}
         
         logger.info("Installing missing dependencies...")
-        successful, failed, messages = install_dependencies_logic(missing_deps, python_exe, package_name_map=package_name_map, verbose=args.verbose)
-        for msg in messages:
-            print(msg)
+        batch_size = args.batch_size if args.batch_size > 0 else len(missing_deps)
+        missing_items = list(missing_deps.items())
+        batches = [dict(missing_items[start:start + batch_size]) for start in range(0, len(missing_items), batch_size)]
+        failed = []
+        # Never in parallel: pip doesn't lock site-packages, and concurrent resolvers
+        # replacing a shared dependency can leave the environment broken
+        for batch in batches:
+            _, batch_failed, messages = install_dependencies_logic(batch, python_exe, package_name_map=package_name_map, verbose=args.verbose, batch=True)
+            failed.extend(batch_failed)
+            _print_messages(messages)
         sys.exit(1 if failed else 0)
 
     elif args.command == "list":
-        packages, messages = list_installed_packages(python_exe, outdated=args.outdated)
-        for msg in messages:
-            print(msg)
+        from dependency_core import _list_installed_packages
+        success, packages, messages = _list_installed_packages(python_exe, args.outdated)
+        if not success:
+            if json_output:
+                sys.stderr.write("\n".join(messages) + "\n")
+            else:
+                _print_messages(messages)
+            sys.exit(1)
+        if json_output:
+            _print_json(packages)
+            sys.exit(0)
+        _print_messages(messages)
         if packages:
-            print("\nInstalled packages:")
-            for pkg in packages:
-                version_info = f"{pkg['name']}=={pkg['version']}"
-                if args.outdated and 'latest_version' in pkg:
-                    version_info += f" (latest: {pkg['latest_version']})"
-                print(f"- {version_info}")
+            pkg_lines = [
+                f"- {pkg['name']}=={pkg['version']}" + (f" (latest: {pkg['latest_version']})" if args.outdated and 'latest_version' in pkg else "")
+                for pkg in packages
+            ]
+            _print_messages(["\nInstalled packages:"] + pkg_lines)
         sys.exit(0)
 
     elif args.command == "upgrade":
+        from dependency_core import upgrade_package
         success, messages = upgrade_package(python_exe, args.package, package_name_map=package_name_map)
-        for msg in messages:
-            print(msg)
+        _print_messages(messages)
         sys.exit(0 if success else 1)
 
     elif args.command == "install-pkg":
+        from dependency_core import install_package
         success, messages = install_package(python_exe, args.package, args.version, package_name_map=package_name_map)
-        for msg in messages:
-            print(msg)
+        _print_messages(messages)
         sys.exit(0 if success else 1)
 
     elif args.command == "check":
+        from dependency_core import check_dependencies
         success, messages = check_dependencies(python_exe)
-        for msg in messages:
-            print(msg)
+        _print_messages(messages)
         sys.exit(0 if success else 1)
 
     elif args.command == "generate-requirements":
-        logger.info(f"Generating requirements.txt in '{args.path}'...")
-        success, messages = generate_requirements_logic(args.path, python_exe, output_file=args.output_file, recursive=args.recursive, python_version=python_info['version'], package_name_map=package_name_map)
-        for msg in messages:
-            print(msg)
+        from dependency_core import generate_requirements_logic
+        logger.info("Generating requirements.txt in '%s'...", args.path)
+        success, messages = generate_requirements_logic(args.path, python_exe, output_file=args.output_file, recursive=args.recursive, python_version=python_info['version'], package_name_map=package_name_map, jobs=args.jobs, use_io_uring=args.io_uring)
+        _print_messages(messages)
         sys.exit(0 if success else 1)
 
     elif args.command == "tree":
+        from dependency_core import dependency_tree_logic
         success, messages = dependency_tree_logic(python_exe, output_format=args.format, package=args.package, reverse=args.reverse)
-        for msg in messages:
-            print(msg)
+        _print_messages(messages)
         sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
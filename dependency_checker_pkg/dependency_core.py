@@ -1,16 +1,20 @@
 # Version 1.7
 
+import ast
 import os
-import subprocess
+import functools
 import re
 import sys
 import json
-from typing import List, Dict, Tuple, Set, Optional
+import types
+import warnings
+from collections import defaultdict
+from typing import Any, FrozenSet, Generator, Iterator, List, Dict, Mapping, Tuple, Set, Optional
 from importlib import resources
 
 # --- Configuration Data ---
 # Mappings for common import names to PyPI package names
-PACKAGE_NAME_MAP = {
+_RAW_MAP = {
     "bs4": "beautifulsoup4",
     "PIL": "Pillow",
     "cv2": "opencv-python",
@@ -28,12 +32,31 @@ PACKAGE_NAME_MAP = {
     "django": "Django",
     "flask": "Flask"
 }
+# Read-only, with import names lowercased once here; look names up with name.lower()
+PACKAGE_NAME_MAP: Mapping[str, str] = types.MappingProxyType({k.lower(): v for k, v in _RAW_MAP.items()})
 
-def load_standard_library_modules(python_version: str) -> Set[str]:
+# Standard library module names reported by probed interpreters (3.10+), per major.minor version
+_probed_stdlib_modules: Dict[str, FrozenSet[str]] = {}
+
+def _register_standard_library_modules(python_version: str, modules: List[str]) -> None:
+    """Records an interpreter's own sys.stdlib_module_names for its major.minor version."""
+    if modules:
+        _probed_stdlib_modules['.'.join(python_version.split('.')[:2])] = frozenset(m.lower() for m in modules)
+
+def load_standard_library_modules(python_version: str) -> FrozenSet[str]:
     """
-    Load standard library modules for the given Python version from JSON files.
-    Returns a set of module names in lowercase.
+    Load standard library modules for the given Python version.
+    Uses the list reported by an interpreter of that version when get_python_info has
+    probed one, else the shipped JSON files.
+    Returns a frozenset of module names in lowercase, cached per major.minor version.
     """
+    major_minor = '.'.join(python_version.split('.')[:2])
+    if major_minor in _probed_stdlib_modules:
+        return _probed_stdlib_modules[major_minor]
+    return _load_standard_library_modules(major_minor)
+
+@functools.lru_cache(maxsize=8)
+def _load_standard_library_modules(major_minor: str) -> FrozenSet[str]:
     version_map = {
         "3.8": "stdlib_3_8.json",
         "3.9": "stdlib_3_9.json",
@@ -42,7 +65,7 @@ def load_standard_library_modules(python_version: str) -> Set[str]:
         "3.12": "stdlib_3_12.json"
     }
     # Default to Python 3.12 if version not found
-    filename = version_map.get(python_version[:3], "stdlib_3_12.json")
+    filename = version_map.get(major_minor, "stdlib_3_12.json")
     
     try:
         # Use importlib.resources to access files in the data directory
@@ -50,52 +73,172 @@ def load_standard_library_modules(python_version: str) -> Set[str]:
             modules = json.load(f)
         if not isinstance(modules, list):
             raise ValueError(f"Standard library file {filename} must contain a JSON array.")
-        return {m.lower() for m in modules}
+        return frozenset(m.lower() for m in modules)
     except Exception as e:
         print(f"Warning: Failed to load standard library modules from {filename}: {e}")
         # Fallback to Python 3.12 standard library
         with resources.open_text("dependency_checker_pkg.data", "stdlib_3_12.json") as f:
             modules = json.load(f)
-        return {m.lower() for m in modules}
+        return frozenset(m.lower() for m in modules)
 
-def load_package_map(file_path: Optional[str] = None) -> Dict[str, str]:
+def load_package_map(file_path: Optional[str] = None) -> Mapping[str, str]:
     """
     Load custom package mappings from a JSON file, merging with default PACKAGE_NAME_MAP.
-    If file_path is None or invalid, return default PACKAGE_NAME_MAP.
+    If file_path is None or invalid, return default PACKAGE_NAME_MAP; an invalid file
+    is reported with a UserWarning on every call.
+    Keys of the returned mapping are lowercase. Successfully loaded maps are cached per
+    (file_path, mtime), so callers must not modify them.
     """
-    package_map = PACKAGE_NAME_MAP.copy()
-    if file_path and os.path.isfile(file_path):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                custom_map = json.load(f)
-            if not isinstance(custom_map, dict):
-                raise ValueError("Custom package map must be a JSON object.")
-            package_map.update({k.lower(): v for k, v in custom_map.items()})
-        except Exception as e:
-            print(f"Warning: Failed to load package map from {file_path}: {e}")
+    if not file_path:
+        return PACKAGE_NAME_MAP
+    try:
+        return _load_package_map_cached(file_path, os.stat(file_path).st_mtime_ns)
+    except Exception as e:
+        # Includes a missing file, which used to be skipped without a word
+        warnings.warn(f"Failed to load package map from {file_path}: {e}", UserWarning)
+        return PACKAGE_NAME_MAP
+
+@functools.lru_cache(maxsize=32)
+def _load_package_map_cached(file_path: str, mtime_ns: int) -> Mapping[str, str]:
+    # Raises on a missing or malformed file, so failures are never cached
+    with open(file_path, 'r', encoding='utf-8') as f:
+        custom_map = json.load(f)
+    if not isinstance(custom_map, dict):
+        raise ValueError("Custom package map must be a JSON object.")
+    package_map = dict(PACKAGE_NAME_MAP)
+    package_map.update({k.lower(): v for k, v in custom_map.items()})
     return package_map
 
+# pip subcommands that don't modify the environment. Their results are cached per
+# (python_exe, arguments) and cleared whenever this module installs or upgrades packages.
+_READ_ONLY_PIP_COMMANDS = frozenset({"show", "list", "check"})
+
+# Directories never descended into while scanning: VCS metadata, caches, virtualenvs and build output.
+# Hidden directories (starting with '.') are skipped as well.
+_SKIP_DIRS = frozenset({
+    '__pycache__', '.git', '.hg', '.svn', 'node_modules', 'venv', '.venv', 'env', '.env',
+    'site-packages', '.tox', '.mypy_cache', '.pytest_cache', 'build', 'dist'
+})
+
+# Python files larger than this are almost always generated code and are not parsed for imports
+MAX_PY_SIZE = 2 * 1024 * 1024
+
+# Below this many files, starting a process pool costs more than parsing sequentially
+_PARALLEL_PARSE_MIN_FILES = 32
+
+# io_uring reads: files submitted per batch, and the per-file read buffer size
+_URING_BATCH_SIZE = 256
+_URING_READ_SIZE = 64 * 1024
+
+# Run in the target interpreter to describe it in one round-trip; stdlib_modules is empty before 3.10.
+# site_dirs covers the user site and distro layouts such as Debian's dist-packages.
+_PYTHON_INFO_PROBE = (
+    "import sys, json, site; "
+    "print(json.dumps({'version': sys.version.split()[0], 'prefix': sys.prefix, 'base_prefix': sys.base_prefix, "
+    "'stdlib_modules': sorted(getattr(sys, 'stdlib_module_names', ())), "
+    "'site_dirs': getattr(site, 'getsitepackages', list)() + [site.getusersitepackages()]}))"
+)
+
+# Upper bound on concurrent 'pip show' subprocesses when the installed set can't be probed
+_PIP_QUERY_WORKERS = 8
+
+# Precompiled patterns used in per-line and per-package loops
+_IMPORT_RE = re.compile(r'^\s*import\s+([a-zA-Z0-9_]+)(?:\s+as\s+[a-zA-Z0-9_]+)?\s*$')
+_FROM_RE = re.compile(r'^\s*from\s+([a-zA-Z0-9_]+)\s+import\b')
+_REQ_SPLIT_RE = re.compile(r'[<>=~!;@\[\s]')
+_DIST_NAME_SEP_RE = re.compile(r'[-_.]+')
+_NO_MATCHING_DIST_RE = re.compile(r'No matching distribution found for ([A-Za-z0-9._-]+)')
+
+# Run in the target interpreter to print its installed distributions as [name, version] pairs
+_DISTRIBUTIONS_PROBE = (
+    "import json, importlib.metadata as m; "
+    "print(json.dumps([[d.metadata['Name'], d.version] for d in m.distributions() if d.metadata['Name']]))"
+)
+
 # --- Core Functions ---
 
-def _run_pip_command(python_exe: str, command_args: List[str]) -> Tuple[int, str, str]:
+def _run_pip_command(python_exe: str, command_args: List[str], stream: bool = False) -> Tuple[int, str, str]:
     """
     Helper to run a pip command using the specified Python executable and capture its output.
+    If stream=True, pip's output is echoed line by line as it arrives (stderr is merged into stdout).
+    Read-only commands (show, list, check) are answered from a cache when repeated.
     Returns (returncode, stdout, stderr).
     """
+    if not stream and command_args and command_args[0] in _READ_ONLY_PIP_COMMANDS:
+        return _run_pip_command_cached(python_exe, tuple(command_args))
+    return _execute_pip_command(python_exe, command_args, stream)
+
+@functools.lru_cache(maxsize=1024)
+def _run_pip_command_cached(python_exe: str, command_args: Tuple[str, ...]) -> Tuple[int, str, str]:
+    return _execute_pip_command(python_exe, list(command_args))
+
+def _invalidate_installed_caches() -> None:
+    """Drops cached views of installed packages after this module changed the environment."""
+    _run_pip_command_cached.cache_clear()
+    _get_installed_distributions.cache_clear()
+
+def _execute_pip_command(python_exe: str, command_args: List[str], stream: bool = False) -> Tuple[int, str, str]:
+    import subprocess
     try:
+        if stream:
+            process = subprocess.Popen(
+                [python_exe, '-m', 'pip'] + command_args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding='utf-8', errors='ignore'
+            )
+            output_lines = []
+            for line in process.stdout:
+                print(line, end='')
+                output_lines.append(line)
+            process.wait()
+            output = ''.join(output_lines)
+            return process.returncode, output, output
+        # Captured as bytes and decoded once, rather than through a text-mode pipe
         process = subprocess.run(
             [python_exe, '-m', 'pip'] + command_args,
             capture_output=True,
-            text=True,
-            check=False,
-            encoding='utf-8', errors='ignore'
+            check=False
         )
-        return process.returncode, process.stdout, process.stderr
+        return process.returncode, process.stdout.decode('utf-8', 'ignore'), process.stderr.decode('utf-8', 'ignore')
     except FileNotFoundError:
         return 1, "", f"Error: Python executable '{python_exe}' not found. Ensure it is installed and in your PATH."
     except Exception as e:
         return 1, "", f"An unexpected error occurred while running pip: {e}"
 
+def _normalize_dist_name(name: str) -> str:
+    """Normalizes a distribution name the way pip compares them (PEP 503)."""
+    return _DIST_NAME_SEP_RE.sub('-', name).lower()
+
+@functools.lru_cache(maxsize=None)
+def _get_installed_distributions(python_exe: str) -> Optional[Dict[str, str]]:
+    """
+    Returns {normalized_name: version} for the distributions installed in the given interpreter,
+    or None if it can't be queried. The running interpreter is read in-process; any other one
+    is probed with a single subprocess. Cleared whenever this module installs or upgrades packages.
+    """
+    try:
+        if python_exe == sys.executable:
+            import importlib.metadata
+            names_versions = [(dist.metadata['Name'], dist.version) for dist in importlib.metadata.distributions() if dist.metadata['Name']]
+        else:
+            import subprocess
+            process = subprocess.run(
+                [python_exe, '-c', _DISTRIBUTIONS_PROBE],
+                capture_output=True,
+                check=True
+            )
+            # The probe prints ASCII-only JSON, which json.loads reads straight from bytes
+            names_versions = json.loads(process.stdout)
+    except Exception:
+        return None
+    distributions = {}
+    for name, version in names_versions:
+        # First match on sys.path wins, as it would for the import system
+        distributions.setdefault(_normalize_dist_name(name), version)
+    return distributions
+
 def check_package_installed(python_exe: str, package_name: str, package_name_map: Optional[Dict[str, str]] = None) -> bool:
     """
     Checks if a package is installed using the specified Python executable.
@@ -104,17 +247,19 @@ def check_package_installed(python_exe: str, package_name: str, package_name_map
     if package_name_map is None:
         package_name_map = PACKAGE_NAME_MAP
 
-    returncode, stdout, stderr = _run_pip_command(python_exe, ['show', package_name])
-    if returncode == 0 and "Name:" in stdout:
-        return True
-
     mapped_name = package_name_map.get(package_name.lower())
-    if mapped_name:
-        returncode, stdout, stderr = _run_pip_command(python_exe, ['show', mapped_name])
-        if returncode == 0 and "Name:" in stdout:
-            return True
+    distributions = _get_installed_distributions(python_exe)
+    if distributions is not None:
+        return _normalize_dist_name(package_name) in distributions or \
+            (mapped_name is not None and _normalize_dist_name(mapped_name) in distributions)
 
-    return False
+    # The interpreter couldn't be probed (e.g. older than 3.8); ask pip instead.
+    # 'pip show' takes several names and succeeds if any of them is installed.
+    names = [package_name]
+    if mapped_name and mapped_name.lower() != package_name.lower():
+        names.append(mapped_name)
+    returncode, stdout, stderr = _run_pip_command(python_exe, ['show'] + names)
+    return returncode == 0 and "Name:" in stdout
 
 def get_package_version(python_exe: str, package_name: str, package_name_map: Optional[Dict[str, str]] = None) -> Optional[str]:
     """
@@ -125,6 +270,10 @@ def get_package_version(python_exe: str, package_name: str, package_name_map: Op
         package_name_map = PACKAGE_NAME_MAP
 
     pypi_name = package_name_map.get(package_name.lower(), package_name)
+    distributions = _get_installed_distributions(python_exe)
+    if distributions is not None:
+        return distributions.get(_normalize_dist_name(pypi_name))
+
     returncode, stdout, stderr = _run_pip_command(python_exe, ['show', pypi_name])
     if returncode == 0 and "Version:" in stdout:
         for line in stdout.splitlines():
@@ -132,37 +281,299 @@ def get_package_version(python_exe: str, package_name: str, package_name_map: Op
                 return line.split(": ")[1].strip()
     return None
 
-def extract_imports_from_file(file_path: str) -> Set[str]:
+def _extract_imports_by_line(source: bytes) -> Set[str]:
     """
-    Extracts top-level module names from import statements in a Python file.
-    Handles 'import foo' and 'from foo import bar'.
+    Line-based fallback for files that don't parse (e.g. Python 2 sources).
+    Handles single-line 'import foo' and 'from foo import bar'.
     """
     imported_modules = set()
+    for line in source.decode('utf-8', errors='ignore').splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        match_import = _IMPORT_RE.match(line)
+        if match_import:
+            module_name = match_import.group(1)
+            if module_name:
+                imported_modules.add(module_name)
+            continue
+        match_from_import = _FROM_RE.match(line)
+        if match_from_import:
+            module_name = match_from_import.group(1)
+            if module_name and not module_name.startswith('.'):
+                imported_modules.add(module_name)
+    return imported_modules
+
+def extract_imports_from_source(source: bytes) -> Set[str]:
+    """
+    Extracts top-level module names from import statements in Python source code.
+    Parses with ast, so multi-line, parenthesized and ';'-separated imports are found;
+    relative imports are skipped. Falls back to a line-based scan if the source doesn't parse.
+    """
+    if b'import' not in source:
+        return set()
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                match_import = re.match(r'^\s*import\s+([a-zA-Z0-9_]+)(\s+as\s+[a-zA-Z0-9_]+)?\s*$', line)
-                if match_import:
-                    module_name = match_import.group(1)
-                    if module_name:
-                        imported_modules.add(module_name)
-                    continue
-                match_from_import = re.match(r'^\s*from\s+([a-zA-Z0-9_]+)\s+import\b', line)
-                if match_from_import:
-                    module_name = match_from_import.group(1)
-                    if module_name and not module_name.startswith('.'):
-                        imported_modules.add(module_name)
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return _extract_imports_by_line(source)
+    imported_modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imported_modules.add(alias.name.split('.')[0])
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            imported_modules.add(node.module.split('.')[0])
+    return imported_modules
+
+def extract_imports_from_file(file_path: str, source: Optional[bytes] = None) -> Set[str]:
+    """
+    Extracts top-level module names from import statements in a Python file.
+    If source is given, it is used instead of reading the file. Files larger than
+    MAX_PY_SIZE are skipped.
+    """
+    try:
+        if source is None:
+            with open(file_path, 'rb') as f:
+                source = f.read(MAX_PY_SIZE + 1)
+        if len(source) > MAX_PY_SIZE:
+            print(f"  Warning: Skipping {file_path} for imports: larger than {MAX_PY_SIZE} bytes (likely generated code)")
+            return set()
+        return extract_imports_from_source(source)
     except Exception as e:
         print(f"  Warning: Could not parse {file_path} for imports: {e}")
-    return imported_modules
+        return set()
 
-def scan_dependencies_logic(folder_path: str, python_exe: str, recursive: bool = True, python_version: Optional[str] = None, package_name_map: Optional[Dict[str, str]] = None) -> Tuple[Dict[str, str], List[str]]:
+def _walk_scandir(folder_path: str, recursive: bool = True) -> Iterator[Tuple[str, List[os.DirEntry], List[os.DirEntry]]]:
     """
-    Scans a folder for Python files and requirements.txt to identify dependencies.
-    Returns (missing_dependencies_dict, scan_summary_messages).
+    Walks folder_path top-down like os.walk, but yields (root, dir_entries, file_entries)
+    with os.DirEntry objects, whose is_dir()/is_file() answers come from the directory
+    listing itself. Symlinked directories, hidden directories and those in _SKIP_DIRS
+    are listed but not descended into.
+    """
+    try:
+        with os.scandir(folder_path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    dirs = []
+    files = []
+    for entry in entries:
+        (dirs if entry.is_dir() else files).append(entry)
+    yield folder_path, dirs, files
+    if recursive:
+        for entry in dirs:
+            if entry.name not in _SKIP_DIRS and not entry.name.startswith('.') and not entry.is_symlink():
+                yield from _walk_scandir(entry.path, recursive=True)
+
+def _is_significant_py_file(entry: os.DirEntry) -> bool:
+    """
+    True for .py files worth parsing; near-empty __init__.py files are skipped.
+    """
+    return entry.name.endswith('.py') and (entry.name != '__init__.py' or entry.stat().st_size >= 50)
+
+def _uring_complete(liburing, ring, cqe, results: List[int]) -> None:
+    """
+    Waits for len(results) completions, storing each result at its user_data index as it
+    is reaped, so the results seen before a failure stay with the caller. Failed operations
+    leave their -1 in place. Raises OSError if waiting itself fails for any reason other
+    than an interrupt; that CQE is not marked as seen then.
+    """
+    for _ in range(len(results)):
+        while True:
+            try:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                break
+            except InterruptedError:
+                continue
+        entry = cqe[0]
+        try:
+            results[entry.user_data] = entry.res
+        except OSError:
+            # The binding raises for a negative result instead of returning it
+            pass
+        liburing.io_uring_cqe_seen(ring, entry)
+
+def _read_files_uring(file_paths: List[str]) -> Optional[Dict[str, bytes]]:
+    """
+    Reads whole files through io_uring, submitting the open, read and close calls for
+    up to _URING_BATCH_SIZE files at a time.
+    Returns {file_path: contents} for the files that could be read, or None when io_uring
+    is unavailable (not Linux, 'liburing' not installed, or the ring cannot be set up).
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        import liburing
+        ring = liburing.Ring()
+        cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(_URING_BATCH_SIZE, ring)
+    except Exception:
+        return None
+
+    contents = {}
+    buffers = [bytearray(_URING_READ_SIZE) for _ in range(min(_URING_BATCH_SIZE, len(file_paths)))]
+    # Descriptors of the current batch that haven't been handed to a close yet, filled in
+    # as each open completes; -1 for an open that failed or hasn't been reaped
+    fds: List[int] = []
+    try:
+        for start in range(0, len(file_paths), _URING_BATCH_SIZE):
+            batch = file_paths[start:start + _URING_BATCH_SIZE]
+            for index, path in enumerate(batch):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_open(sqe, path, os.O_RDONLY | os.O_CLOEXEC)
+                sqe.user_data = index
+            liburing.io_uring_submit(ring)
+            fds = [-1] * len(batch)
+            _uring_complete(liburing, ring, cqe, fds)
+            opened = [(path, fd) for path, fd in zip(batch, fds) if fd >= 0]
+
+            for index, (_, fd) in enumerate(opened):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_read(sqe, fd, buffers[index], 0)
+                sqe.user_data = index
+            liburing.io_uring_submit(ring)
+            sizes = [-1] * len(opened)
+            _uring_complete(liburing, ring, cqe, sizes)
+
+            for index, ((path, fd), size) in enumerate(zip(opened, sizes)):
+                if size < 0:
+                    continue
+                data = bytes(buffers[index][:size])
+                if size == _URING_READ_SIZE:
+                    # Larger than the read buffer; fetch the rest synchronously
+                    chunks = [data]
+                    while True:
+                        chunk = os.pread(fd, _URING_READ_SIZE, size)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                        size += len(chunk)
+                    data = b''.join(chunks)
+                contents[path] = data
+
+            # Forget the descriptors before submitting their closes: closing one twice
+            # could close an unrelated file that has been given the same number
+            fds = []
+            for index, (_, fd) in enumerate(opened):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_close(sqe, fd)
+                sqe.user_data = index
+            liburing.io_uring_submit(ring)
+            _uring_complete(liburing, ring, cqe, [-1] * len(opened))
+    except Exception as e:
+        print(f"  Warning: io_uring read failed, falling back to regular reads: {e}")
+    finally:
+        for fd in fds:
+            if fd >= 0:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        liburing.io_uring_queue_exit(ring)
+    return contents
+
+def _parse_imports(file_paths: List[str], jobs: int = 1, use_io_uring: bool = False) -> Dict[str, Set[str]]:
+    """
+    Parses Python files for imports. Returns {file_path: imported_modules}.
+    With use_io_uring=True the files are read in batches through io_uring when available.
+    With jobs > 1 and enough files to amortize the start-up, parsing runs in a process pool.
+    """
+    sources = (_read_files_uring(file_paths) if use_io_uring else None) or {}
+    file_sources = [sources.get(path) for path in file_paths]
+    if jobs > 1 and len(file_paths) >= _PARALLEL_PARSE_MIN_FILES:
+        # Imported here: the process pool pulls in multiprocessing and subprocess
+        from concurrent.futures import ProcessPoolExecutor
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                return dict(zip(file_paths, executor.map(extract_imports_from_file, file_paths, file_sources, chunksize=16)))
+        except Exception as e:
+            print(f"  Warning: Parallel import parsing unavailable, falling back to sequential: {e}")
+    return {path: extract_imports_from_file(path, source) for path, source in zip(file_paths, file_sources)}
+
+def _collect_messages(generator: Generator[str, None, Any]) -> Any:
+    """
+    Runs a message generator to completion for callers that want a list.
+    Returns its return value with the messages appended: a tuple is extended, anything else paired.
+    """
+    messages = []
+    while True:
+        try:
+            messages.append(next(generator))
+        except StopIteration as stop:
+            result = stop.value
+            return (*result, messages) if isinstance(result, tuple) else (result, messages)
+
+def _directory_names(walk_results: List[Tuple[str, List[os.DirEntry], List[os.DirEntry]]]) -> Dict[str, Set[str]]:
+    """Maps each walked directory to the names of the entries it contains."""
+    return {root: {entry.name for entry in dirs} | {entry.name for entry in files} for root, dirs, files in walk_results}
+
+def _is_local_module(module: str, project_names: Set[str], dir_names: Set[str]) -> bool:
+    """
+    Checks whether an import refers to a module or package inside the scanned project:
+    one in the project root (project_names) or next to the importing file (dir_names).
+    """
+    return module + '.py' in project_names or module in project_names or \
+        module + '.py' in dir_names or module in dir_names
+
+def _read_requirement_names(req_file_path: str, python_version: Optional[str] = None) -> List[str]:
+    """
+    Returns the package names listed in a requirements file, in file order.
+    Lines are parsed with packaging's Requirement when it is installed, so extras, markers
+    and URL requirements are understood; otherwise (or for lines it rejects) the name is
+    everything up to the first specifier character. Option lines (-r, -e, --index-url, ...)
+    are skipped, and so are requirements whose environment marker doesn't match, evaluated
+    for python_version (the target interpreter's) when given.
+    """
+    try:
+        from packaging.requirements import InvalidRequirement, Requirement
+    except ImportError:
+        Requirement = None
+    marker_environment = None
+    if python_version:
+        marker_environment = {
+            "python_version": '.'.join(python_version.split('.')[:2]),
+            "python_full_version": python_version,
+        }
+    package_names = []
+    with open(req_file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            line = line.split(' #', 1)[0].strip()
+            if not line or line.startswith(('#', '-')):
+                continue
+            package_name = None
+            if Requirement is not None:
+                try:
+                    requirement = Requirement(line)
+                except InvalidRequirement:
+                    pass
+                else:
+                    if requirement.marker is not None and not requirement.marker.evaluate(marker_environment):
+                        continue
+                    package_name = requirement.name
+            if package_name is None:
+                package_name = _REQ_SPLIT_RE.split(line, 1)[0]
+            if package_name:
+                package_names.append(package_name)
+    return package_names
+
+def _check_packages_installed(python_exe: str, package_names: List[str], package_name_map: Dict[str, str]) -> Dict[str, bool]:
+    """
+    Checks several packages at once. Returns {package_name: installed}.
+    Against the probed distributions these are dictionary lookups; if the interpreter can't
+    be probed, each check needs its own 'pip show', so they run in a thread pool.
+    """
+    unique_names = list(dict.fromkeys(package_names))
+    if _get_installed_distributions(python_exe) is not None or len(unique_names) < 2:
+        return {name: check_package_installed(python_exe, name, package_name_map) for name in unique_names}
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(_PIP_QUERY_WORKERS, len(unique_names))) as executor:
+        results = executor.map(lambda name: check_package_installed(python_exe, name, package_name_map), unique_names)
+        return dict(zip(unique_names, results))
+
+def _scan_iter(folder_path: str, python_exe: str, recursive: bool = True, python_version: Optional[str] = None, package_name_map: Optional[Dict[str, str]] = None, jobs: int = 1, use_io_uring: bool = False) -> Generator[str, None, Dict[str, str]]:
+    """
+    Generator behind scan_dependencies_logic: yields the scan summary messages as the scan
+    progresses and returns the missing dependencies dict.
     """
     if python_version is None:
         python_info = get_python_info(python_exe)
@@ -172,97 +583,111 @@ def scan_dependencies_logic(folder_path: str, python_exe: str, recursive: bool =
         package_name_map = PACKAGE_NAME_MAP
 
     missing_dependencies = {}
-    scan_summary_messages = []
     found_dependencies_to_check = False
 
-    scan_summary_messages.append(f"Scanning folder: {folder_path} with Python: {python_exe} (version {python_version})")
+    yield f"Scanning folder: {folder_path} with Python: {python_exe} (version {python_version})"
 
-    walk_generator = os.walk(folder_path)
-    if not recursive:
-        try:
-            root, dirs, files = next(walk_generator)
-            walk_generator = [(root, dirs, files)]
-        except StopIteration:
-            scan_summary_messages.append("\nSelected folder is empty or contains no relevant files.")
-            return missing_dependencies, scan_summary_messages
-
-    for root, _, files in walk_generator:
-        for file in files:
-            if file == 'requirements.txt':
-                found_dependencies_to_check = True
-                req_file_path = os.path.join(root, file)
-                scan_summary_messages.append(f"\n--- Checking '{file}' ({os.path.relpath(req_file_path, folder_path)}) ---")
+    walk_results = list(_walk_scandir(folder_path, recursive))
+    if not recursive and not walk_results:
+        yield "\nSelected folder is empty or contains no relevant files."
+        return missing_dependencies
+    parsed_imports = _parse_imports(
+        [entry.path for _, _, files in walk_results for entry in files if _is_significant_py_file(entry)], jobs, use_io_uring)
+    directory_names = _directory_names(walk_results)
+    project_names = directory_names.get(folder_path, set())
+
+    # Gather everything that needs an installation check first, so each name is checked once
+    requirement_names = {}
+    names_to_check = []
+    module_sources = defaultdict(list)
+    for root, _, files in walk_results:
+        for entry in files:
+            if entry.name == 'requirements.txt':
                 try:
-                    with open(req_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        for line in f:
-                            line = line.strip()
-                            if line and not line.startswith('#'):
-                                package_name = re.split(r'[<>=~]', line)[0].strip()
-                                if package_name:
-                                    scan_summary_messages.append(f"  Checking '{package_name}'...")
-                                    if not check_package_installed(python_exe, package_name, package_name_map):
-                                        display_name = package_name_map.get(package_name.lower(), package_name)
-                                        missing_dependencies[package_name] = f'requirements.txt ({os.path.relpath(req_file_path, folder_path)})'
-                                        scan_summary_messages.append(f"  ❌ Missing: {display_name}")
-                                    else:
-                                        display_name = package_name_map.get(package_name.lower(), package_name)
-                                        scan_summary_messages.append(f"  ✅ Installed: {display_name}")
+                    requirement_names[entry.path] = _read_requirement_names(entry.path, python_version)
+                    names_to_check.extend(requirement_names[entry.path])
                 except Exception as e:
-                    scan_summary_messages.append(f"  Error reading {req_file_path}: {e}")
+                    requirement_names[entry.path] = e
+            elif _is_significant_py_file(entry):
+                for module in sorted(parsed_imports[entry.path]):
+                    if module.lower() not in standard_lib_modules and not _is_local_module(module, project_names, directory_names[root]):
+                        module_sources[module].append(os.path.relpath(entry.path, folder_path))
+    names_to_check.extend(module_sources)
+    installed = _check_packages_installed(python_exe, names_to_check, package_name_map)
 
-            elif file.endswith('.py'):
-                py_file_path = os.path.join(root, file)
-                if file == '__init__.py' and os.path.getsize(py_file_path) < 50:
+    for root, _, files in walk_results:
+        for entry in files:
+            file = entry.name
+            if file == 'requirements.txt':
+                found_dependencies_to_check = True
+                req_file_path = entry.path
+                yield f"\n--- Checking '{file}' ({os.path.relpath(req_file_path, folder_path)}) ---"
+                package_names = requirement_names[req_file_path]
+                if isinstance(package_names, Exception):
+                    yield f"  Error reading {req_file_path}: {package_names}"
                     continue
+                for package_name in package_names:
+                    yield f"  Checking '{package_name}'..."
+                    display_name = package_name_map.get(package_name.lower(), package_name)
+                    if not installed[package_name]:
+                        missing_dependencies[package_name] = f'requirements.txt ({os.path.relpath(req_file_path, folder_path)})'
+                        yield f"  ❌ Missing: {display_name}"
+                    else:
+                        yield f"  ✅ Installed: {display_name}"
 
+            elif _is_significant_py_file(entry):
+                py_file_path = entry.path
                 found_dependencies_to_check = True
-                scan_summary_messages.append(f"\n--- Checking '{file}' ({os.path.relpath(py_file_path, folder_path)}) for imports ---")
-                imported_modules = extract_imports_from_file(py_file_path)
+                yield f"\n--- Checking '{file}' ({os.path.relpath(py_file_path, folder_path)}) for imports ---"
+                imported_modules = parsed_imports[py_file_path]
 
-                for module in imported_modules:
+                for module in sorted(imported_modules):
                     module_lower = module.lower()
                     if module_lower in standard_lib_modules:
-                        scan_summary_messages.append(f"  (Skipping built-in/standard: {module})")
+                        yield f"  (Skipping built-in/standard: {module})"
                         continue
 
-                    is_local_module = False
-                    if os.path.exists(os.path.join(folder_path, module + '.py')) or \
-                       os.path.exists(os.path.join(folder_path, module)) or \
-                       os.path.exists(os.path.join(root, module + '.py')) or \
-                       os.path.exists(os.path.join(root, module)):
-                        is_local_module = True
-
-                    if is_local_module:
-                        scan_summary_messages.append(f"  (Skipping local module: {module})")
+                    if _is_local_module(module, project_names, directory_names[root]):
+                        yield f"  (Skipping local module: {module})"
                         continue
 
                     display_module_name = package_name_map.get(module.lower(), module)
-                    scan_summary_messages.append(f"  Checking '{display_module_name}' (from import)...")
-                    if not check_package_installed(python_exe, module, package_name_map):
+                    yield f"  Checking '{display_module_name}' (from import)..."
+                    if not installed[module]:
                         if module not in missing_dependencies:
-                            missing_dependencies[module] = f'import in {os.path.relpath(py_file_path, folder_path)}'
-                            scan_summary_messages.append(f"  ❌ Missing: {display_module_name}")
+                            sources = module_sources[module]
+                            missing_dependencies[module] = f'import in {sources[0]}' + (f' (+{len(sources) - 1} more)' if len(sources) > 1 else '')
+                            yield f"  ❌ Missing: {display_module_name}"
                     else:
-                        scan_summary_messages.append(f"  ✅ Installed: {display_module_name}")
+                        yield f"  ✅ Installed: {display_module_name}"
 
     if not found_dependencies_to_check and not missing_dependencies:
-        scan_summary_messages.append("\nNo 'requirements.txt' files or Python files with significant imports found.")
+        yield "\nNo 'requirements.txt' files or Python files with significant imports found."
     elif missing_dependencies:
-        scan_summary_messages.append("\n--- Scan Complete ---")
-        scan_summary_messages.append("\nSummary of Missing Dependencies:")
+        yield "\n--- Scan Complete ---"
+        yield "\nSummary of Missing Dependencies:"
         for pkg, src in missing_dependencies.items():
             display_pkg_name = package_name_map.get(pkg.lower(), pkg)
-            scan_summary_messages.append(f"- {display_pkg_name} (from {src})")
+            yield f"- {display_pkg_name} (from {src})"
     else:
-        scan_summary_messages.append("\n--- Scan Complete ---")
-        scan_summary_messages.append("\nAll detected dependencies are installed! ✅")
+        yield "\n--- Scan Complete ---"
+        yield "\nAll detected dependencies are installed! ✅"
 
-    return missing_dependencies, scan_summary_messages
+    return missing_dependencies
 
-def generate_requirements_logic(folder_path: str, python_exe: str, output_file: str = "requirements.txt", recursive: bool = True, python_version: Optional[str] = None, package_name_map: Optional[Dict[str, str]] = None) -> Tuple[bool, List[str]]:
+def scan_dependencies_logic(folder_path: str, python_exe: str, recursive: bool = True, python_version: Optional[str] = None, package_name_map: Optional[Dict[str, str]] = None, jobs: int = 1, use_io_uring: bool = False) -> Tuple[Dict[str, str], List[str]]:
     """
-    Generates a requirements.txt file based on imports in Python files.
-    Returns (success, messages).
+    Scans a folder for Python files and requirements.txt to identify dependencies.
+    With jobs > 1, Python files are parsed for imports in a process pool; with
+    use_io_uring=True they are read through io_uring when it is available (Linux).
+    Returns (missing_dependencies_dict, scan_summary_messages).
+    """
+    return _collect_messages(_scan_iter(folder_path, python_exe, recursive, python_version, package_name_map, jobs, use_io_uring))
+
+def _generate_requirements_iter(folder_path: str, python_exe: str, output_file: str = "requirements.txt", recursive: bool = True, python_version: Optional[str] = None, package_name_map: Optional[Dict[str, str]] = None, jobs: int = 1, use_io_uring: bool = False) -> Generator[str, None, bool]:
+    """
+    Generator behind generate_requirements_logic: yields progress messages and returns
+    whether requirements were written.
     """
     if python_version is None:
         python_info = get_python_info(python_exe)
@@ -271,51 +696,52 @@ def generate_requirements_logic(folder_path: str, python_exe: str, output_file:
     if package_name_map is None:
         package_name_map = PACKAGE_NAME_MAP
 
-    messages = []
     dependencies = set()
 
-    messages.append(f"Generating requirements.txt from imports in '{folder_path}' with Python: {python_exe} (version {python_version})")
+    yield f"Generating requirements.txt from imports in '{folder_path}' with Python: {python_exe} (version {python_version})"
 
-    walk_generator = os.walk(folder_path)
-    if not recursive:
-        try:
-            root, dirs, files = next(walk_generator)
-            walk_generator = [(root, dirs, files)]
-        except StopIteration:
-            messages.append("\nSelected folder is empty or contains no relevant files.")
-            return False, messages
-
-    for root, _, files in walk_generator:
-        for file in files:
-            if file.endswith('.py') and (file != '__init__.py' or os.path.getsize(os.path.join(root, file)) >= 50):
-                py_file_path = os.path.join(root, file)
-                messages.append(f"\n--- Scanning '{file}' ({os.path.relpath(py_file_path, folder_path)}) for imports ---")
-                imported_modules = extract_imports_from_file(py_file_path)
-                for module in imported_modules:
+    walk_results = list(_walk_scandir(folder_path, recursive))
+    if not recursive and not walk_results:
+        yield "\nSelected folder is empty or contains no relevant files."
+        return False
+    parsed_imports = _parse_imports(
+        [entry.path for _, _, files in walk_results for entry in files if _is_significant_py_file(entry)], jobs, use_io_uring)
+    directory_names = _directory_names(walk_results)
+    project_names = directory_names.get(folder_path, set())
+
+    installed = _check_packages_installed(python_exe, [
+        module
+        for root, _, files in walk_results for entry in files if _is_significant_py_file(entry)
+        for module in parsed_imports[entry.path]
+        if module.lower() not in standard_lib_modules and not _is_local_module(module, project_names, directory_names[root])
+    ], package_name_map)
+
+    for root, _, files in walk_results:
+        for entry in files:
+            file = entry.name
+            if _is_significant_py_file(entry):
+                py_file_path = entry.path
+                yield f"\n--- Scanning '{file}' ({os.path.relpath(py_file_path, folder_path)}) for imports ---"
+                imported_modules = parsed_imports[py_file_path]
+                for module in sorted(imported_modules):
                     module_lower = module.lower()
                     if module_lower in standard_lib_modules:
-                        messages.append(f"  (Skipping built-in/standard: {module})")
+                        yield f"  (Skipping built-in/standard: {module})"
                         continue
-                    is_local_module = False
-                    if os.path.exists(os.path.join(folder_path, module + '.py')) or \
-                       os.path.exists(os.path.join(folder_path, module)) or \
-                       os.path.exists(os.path.join(root, module + '.py')) or \
-                       os.path.exists(os.path.join(root, module)):
-                        is_local_module = True
-                    if is_local_module:
-                        messages.append(f"  (Skipping local module: {module})")
+                    if _is_local_module(module, project_names, directory_names[root]):
+                        yield f"  (Skipping local module: {module})"
                         continue
-                    if check_package_installed(python_exe, module, package_name_map):
+                    if installed[module]:
                         version = get_package_version(python_exe, module, package_name_map)
                         pypi_name = package_name_map.get(module.lower(), module)
                         dependencies.add(f"{pypi_name}=={version}" if version else pypi_name)
-                        messages.append(f"  ✅ Found: {pypi_name} (version: {version or 'unknown'})")
+                        yield f"  ✅ Found: {pypi_name} (version: {version or 'unknown'})"
                     else:
-                        messages.append(f"  ❌ Not installed: {package_name_map.get(module.lower(), module)} (skipping from requirements)")
+                        yield f"  ❌ Not installed: {package_name_map.get(module.lower(), module)} (skipping from requirements)"
 
     if not dependencies:
-        messages.append("\nNo external dependencies found to include in requirements.txt.")
-        return False, messages
+        yield "\nNo external dependencies found to include in requirements.txt."
+        return False
 
     try:
         output_path = os.path.join(folder_path, output_file)
@@ -323,11 +749,20 @@ def generate_requirements_logic(folder_path: str, python_exe: str, output_file:
             f.write("# Generated by dependency manager\n")
             for dep in sorted(dependencies):
                 f.write(f"{dep}\n")
-        messages.append(f"\nSuccessfully generated '{output_file}' with {len(dependencies)} dependencies.")
-        return True, messages
+        yield f"\nSuccessfully generated '{output_file}' with {len(dependencies)} dependencies."
+        return True
     except Exception as e:
-        messages.append(f"\nError writing '{output_file}': {e}")
-        return False, messages
+        yield f"\nError writing '{output_file}': {e}"
+        return False
+
+def generate_requirements_logic(folder_path: str, python_exe: str, output_file: str = "requirements.txt", recursive: bool = True, python_version: Optional[str] = None, package_name_map: Optional[Dict[str, str]] = None, jobs: int = 1, use_io_uring: bool = False) -> Tuple[bool, List[str]]:
+    """
+    Generates a requirements.txt file based on imports in Python files.
+    With jobs > 1, Python files are parsed for imports in a process pool; with
+    use_io_uring=True they are read through io_uring when it is available (Linux).
+    Returns (success, messages).
+    """
+    return _collect_messages(_generate_requirements_iter(folder_path, python_exe, output_file, recursive, python_version, package_name_map, jobs, use_io_uring))
 
 def dependency_tree_logic(python_exe: str, output_format: str = "text", package: Optional[str] = None, reverse: bool = False) -> Tuple[bool, List[str]]:
     """
@@ -360,10 +795,46 @@ def dependency_tree_logic(python_exe: str, output_format: str = "text", package:
         messages.append("HINT: Ensure 'pipdeptree' is installed (pip install pipdeptree) and GraphViz is installed for graph outputs.")
         return False, messages
 
-def install_dependencies_logic(missing_dependencies: Dict[str, str], python_exe: str, package_name_map: Optional[Dict[str, str]] = None, verbose: bool = False) -> Tuple[List[str], List[str], List[str]]:
+def _format_install_error(pypi_package_name: str, error_output: str) -> str:
     """
-    Performs pip installations for missing dependencies, skipping standard library modules.
-    Returns (successful_installs, failed_installs, installation_messages).
+    Appends a HINT for well-known pip failure causes to the error output.
+    """
+    if "Microsoft Visual C++ 14.0 or greater is required" in error_output:
+        error_output += "\n  (HINT: Install Microsoft C++ Build Tools: https://visualstudio.microsoft.com/visual-cpp-build-tools/)"
+    elif "No matching distribution found for" in error_output:
+        error_output += f"\n  (HINT: '{pypi_package_name}' may be a standard library module or unavailable on PyPI.)"
+    elif "Permission denied" in error_output or "Access is denied" in error_output:
+        error_output += "\n  (HINT: Run as administrator or check permissions.)"
+    elif "Connection aborted" in error_output or "Failed to establish a new connection" in error_output:
+        error_output += "\n  (HINT: Check your internet connection.)"
+    return error_output
+
+def _parse_batch_install_output(output: str, pypi_package_names: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Attributes the output of a failed batch 'pip install' to individual packages.
+    Returns (installed, not_found): packages pip reports as installed, and packages pip
+    could not find on the index. Names are matched on their normalized form.
+    """
+    by_normalized_name = {_normalize_dist_name(name): name for name in pypi_package_names}
+    installed = []
+    not_found = []
+    for line in output.splitlines():
+        if line.startswith("Successfully installed "):
+            for name_version in line[len("Successfully installed "):].split():
+                name = by_normalized_name.get(_normalize_dist_name(name_version.rsplit('-', 1)[0]))
+                if name and name not in installed:
+                    installed.append(name)
+        match = _NO_MATCHING_DIST_RE.search(line)
+        if match:
+            name = by_normalized_name.get(_normalize_dist_name(match.group(1)))
+            if name and name not in not_found:
+                not_found.append(name)
+    return installed, not_found
+
+def _install_iter(missing_dependencies: Dict[str, str], python_exe: str, package_name_map: Optional[Dict[str, str]] = None, verbose: bool = False, batch: bool = True) -> Generator[str, None, Tuple[List[str], List[str]]]:
+    """
+    Generator behind install_dependencies_logic: yields installation messages as packages
+    are installed and returns (successful_installs, failed_installs).
     """
     if package_name_map is None:
         package_name_map = PACKAGE_NAME_MAP
@@ -371,84 +842,129 @@ def install_dependencies_logic(missing_dependencies: Dict[str, str], python_exe:
     python_info = get_python_info(python_exe)
     standard_lib_modules = load_standard_library_modules(python_info['version'])
 
-    installation_messages = []
     successful_installs = []
     failed_installs = []
 
     if not missing_dependencies:
-        installation_messages.append("No missing dependencies to install.")
-        return successful_installs, failed_installs, installation_messages
+        yield "No missing dependencies to install."
+        return successful_installs, failed_installs
 
-    installation_messages.append("\n--- Starting Installation ---")
+    yield "\n--- Starting Installation ---"
 
     packages_to_install_pypi_names = []
-    original_missing_keys = []
     for pkg in missing_dependencies:
         if pkg.lower() in standard_lib_modules:
-            installation_messages.append(f"  Skipping '{pkg}' (standard library module, no installation needed).")
+            yield f"  Skipping '{pkg}' (standard library module, no installation needed)."
             continue
         packages_to_install_pypi_names.append(package_name_map.get(pkg.lower(), pkg))
-        original_missing_keys.append(pkg)
 
-    for i, pypi_package_name in enumerate(packages_to_install_pypi_names):
-        original_module_name = original_missing_keys[i]
-        installation_messages.append(f"Installing '{pypi_package_name}'...")
+    packages_to_install_individually = packages_to_install_pypi_names
+    if batch and len(packages_to_install_pypi_names) > 1:
+        yield f"Installing {len(packages_to_install_pypi_names)} packages in one batch: {', '.join(packages_to_install_pypi_names)}..."
+        if verbose:
+            print(f"DEBUG: Attempting to install: {' '.join(packages_to_install_pypi_names)}")
+
+        returncode, stdout, stderr = _run_pip_command(python_exe, ['install', '--no-input'] + packages_to_install_pypi_names, stream=verbose)
+
+        if returncode == 0:
+            for pypi_package_name in packages_to_install_pypi_names:
+                yield f"  ✅ Successfully installed: {pypi_package_name}"
+                successful_installs.append(pypi_package_name)
+            packages_to_install_individually = []
+        else:
+            installed, not_found = _parse_batch_install_output(stdout + "\n" + stderr, packages_to_install_pypi_names)
+            for pypi_package_name in installed:
+                yield f"  ✅ Successfully installed: {pypi_package_name}"
+                successful_installs.append(pypi_package_name)
+            for pypi_package_name in not_found:
+                error_output = _format_install_error(pypi_package_name, f"ERROR: No matching distribution found for {pypi_package_name}")
+                yield f"  ❌ Failed to install {pypi_package_name}:\n{error_output}"
+                failed_installs.append(pypi_package_name)
+            packages_to_install_individually = [name for name in packages_to_install_pypi_names if name not in installed and name not in not_found]
+            if packages_to_install_individually:
+                yield "  Batch installation failed, retrying remaining packages individually..."
+
+        if verbose:
+            print(f"DEBUG: Batch installation finished with return code {returncode}")
+
+    for pypi_package_name in packages_to_install_individually:
+        yield f"Installing '{pypi_package_name}'..."
         if verbose:
             print(f"DEBUG: Attempting to install: {pypi_package_name}")
 
-        returncode, stdout, stderr = _run_pip_command(python_exe, ['install', pypi_package_name])
+        returncode, stdout, stderr = _run_pip_command(python_exe, ['install', '--no-input', pypi_package_name])
 
         if returncode == 0:
-            installation_messages.append(f"  ✅ Successfully installed: {pypi_package_name}")
+            yield f"  ✅ Successfully installed: {pypi_package_name}"
             successful_installs.append(pypi_package_name)
         else:
-            error_output = stderr
-            if "Microsoft Visual C++ 14.0 or greater is required" in error_output:
-                error_output += "\n  (HINT: Install Microsoft C++ Build Tools: https://visualstudio.microsoft.com/visual-cpp-build-tools/)"
-            elif "No matching distribution found for" in error_output:
-                error_output += f"\n  (HINT: '{pypi_package_name}' may be a standard library module or unavailable on PyPI.)"
-            elif "Permission denied" in error_output or "Access is denied" in error_output:
-                error_output += "\n  (HINT: Run as administrator or check permissions.)"
-            elif "Connection aborted" in error_output or "Failed to establish a new connection" in error_output:
-                error_output += "\n  (HINT: Check your internet connection.)"
-
-            installation_messages.append(f"  ❌ Failed to install {pypi_package_name}:\n{error_output}")
+            error_output = _format_install_error(pypi_package_name, stderr)
+            yield f"  ❌ Failed to install {pypi_package_name}:\n{error_output}"
             failed_installs.append(pypi_package_name)
 
         if verbose:
             print(f"DEBUG: Installation of {pypi_package_name} finished with return code {returncode}")
 
-    installation_messages.append("\n--- Installation Summary ---")
     if successful_installs:
-        installation_messages.append(f"Successfully installed: {', '.join(successful_installs)}")
+        _invalidate_installed_caches()
+
+    yield "\n--- Installation Summary ---"
+    if successful_installs:
+        yield f"Successfully installed: {', '.join(successful_installs)}"
     if failed_installs:
-        installation_messages.append(f"Failed to install: {', '.join(failed_installs)}")
+        yield f"Failed to install: {', '.join(failed_installs)}"
     else:
-        installation_messages.append("All missing dependencies installed successfully! ✅")
+        yield "All missing dependencies installed successfully! ✅"
+
+    return successful_installs, failed_installs
 
-    return successful_installs, failed_installs, installation_messages
+def install_dependencies_logic(missing_dependencies: Dict[str, str], python_exe: str, package_name_map: Optional[Dict[str, str]] = None, verbose: bool = False, batch: bool = True) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Performs pip installations for missing dependencies, skipping standard library modules.
+    By default all packages are passed to a single 'pip install' invocation so pip resolves
+    them once. When that fails, packages pip reported as installed or not found are attributed
+    from its output and the rest are retried one by one. batch=False installs one at a time.
+    Returns (successful_installs, failed_installs, installation_messages).
+    """
+    return _collect_messages(_install_iter(missing_dependencies, python_exe, package_name_map, verbose, batch))
 
 def list_installed_packages(python_exe: str, outdated: bool = False) -> Tuple[List[Dict[str, str]], List[str]]:
     """
     List installed packages using pip list.
     If outdated=True, only show outdated packages.
+    The running interpreter's packages are listed in-process; only other interpreters,
+    or outdated=True (which has to query the index), go through pip.
     Returns (packages, messages).
     """
+    _, packages, messages = _list_installed_packages(python_exe, outdated)
+    return packages, messages
+
+def _list_installed_packages(python_exe: str, outdated: bool) -> Tuple[bool, List[Dict[str, str]], List[str]]:
+    """list_installed_packages, plus whether the listing succeeded: (success, packages, messages)."""
+    if not outdated and python_exe == sys.executable:
+        import importlib.metadata
+        seen = set()
+        packages = []
+        for dist in importlib.metadata.distributions():
+            name = dist.metadata['Name']
+            # Like pip, report only the first distribution of each name on sys.path
+            if name and _normalize_dist_name(name) not in seen:
+                seen.add(_normalize_dist_name(name))
+                packages.append({"name": name, "version": dist.version})
+        packages.sort(key=lambda pkg: _normalize_dist_name(pkg["name"]))
+        return True, packages, [f"Found {len(packages)} installed packages."]
+
     command = ["list", "--format=json"]
     if outdated:
         command.append("--outdated")
     returncode, stdout, stderr = _run_pip_command(python_exe, command)
-    packages = []
-    messages = []
-    if returncode == 0:
-        try:
-            packages = json.loads(stdout)
-            messages.append(f"Found {len(packages)} {'outdated' if outdated else 'installed'} packages.")
-        except json.JSONDecodeError:
-            messages.append(f"Error parsing pip list output: {stdout}")
-    else:
-        messages.append(f"Error listing packages: {stderr}")
-    return packages, messages
+    if returncode != 0:
+        return False, [], [f"Error listing packages: {stderr}"]
+    try:
+        packages = json.loads(stdout)
+    except json.JSONDecodeError:
+        return False, [], [f"Error parsing pip list output: {stdout}"]
+    return True, packages, [f"Found {len(packages)} {'outdated' if outdated else 'installed'} packages."]
 
 def upgrade_package(python_exe: str, package_name: str, package_name_map: Optional[Dict[str, str]] = None) -> Tuple[bool, List[str]]:
     """
@@ -463,6 +979,7 @@ def upgrade_package(python_exe: str, package_name: str, package_name_map: Option
     if pypi_name.lower() in standard_lib_modules:
         return False, [f"Cannot upgrade '{pypi_name}' (standard library module)."]
     returncode, stdout, stderr = _run_pip_command(python_exe, ["install", "--upgrade", pypi_name])
+    _invalidate_installed_caches()
     messages = [f"Upgrading '{pypi_name}'..."]
     if returncode == 0:
         messages.append(f"  ✅ Successfully upgraded: {pypi_name}")
@@ -484,6 +1001,7 @@ def install_package(python_exe: str, package_name: str, version: Optional[str] =
         return False, [f"Cannot install '{pypi_name}' (standard library module)."]
     package_spec = f"{pypi_name}=={version}" if version else pypi_name
     returncode, stdout, stderr = _run_pip_command(python_exe, ["install", package_spec])
+    _invalidate_installed_caches()
     messages = [f"Installing '{package_spec}'..."]
     if returncode == 0:
         messages.append(f"  ✅ Successfully installed: {package_spec}")
@@ -491,77 +1009,113 @@ def install_package(python_exe: str, package_name: str, version: Optional[str] =
         messages.append(f"  ❌ Failed to install {package_spec}: {stderr}")
     return returncode == 0, messages
 
+def _check_dependencies_in_process() -> Optional[Tuple[int, str, str]]:
+    """
+    Does what 'pip check' does for the running interpreter, without starting pip: every
+    installed distribution's Requires-Dist is checked against the installed set.
+    Returns (returncode, stdout, stderr) shaped like pip's, or None if 'packaging' is missing.
+    """
+    try:
+        from packaging.requirements import InvalidRequirement, Requirement
+        from packaging.version import InvalidVersion, Version
+    except ImportError:
+        return None
+    import importlib.metadata
+
+    installed = {}
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata['Name']
+        if name:
+            installed.setdefault(_normalize_dist_name(name), dist)
+
+    problems = []
+    for project_name, dist in sorted(installed.items()):
+        for requirement_line in dist.requires or []:
+            try:
+                req = Requirement(requirement_line)
+            except InvalidRequirement:
+                continue
+            if req.marker is not None and not req.marker.evaluate({"extra": ""}):
+                continue
+            dep_name = _normalize_dist_name(req.name)
+            if dep_name not in installed:
+                problems.append(f"{project_name} {dist.version} requires {dep_name}, which is not installed.")
+                continue
+            dep_version = installed[dep_name].version
+            try:
+                satisfied = req.specifier.contains(Version(dep_version), prereleases=True)
+            except InvalidVersion:
+                satisfied = True
+            if not satisfied:
+                problems.append(f"{project_name} {dist.version} has requirement {req}, but you have {dep_name} {dep_version}.")
+
+    if problems:
+        return 1, "\n".join(problems) + "\n", ""
+    return 0, "No broken requirements found.\n", ""
+
 def check_dependencies(python_exe: str) -> Tuple[bool, List[str]]:
     """
     Check for broken dependencies using pip check.
+    The running interpreter is checked in-process when 'packaging' is available.
     Returns (success, messages).
     """
-    returncode, stdout, stderr = _run_pip_command(python_exe, ["check"])
+    result = _check_dependencies_in_process() if python_exe == sys.executable else None
+    returncode, stdout, stderr = result or _run_pip_command(python_exe, ["check"])
     messages = [f"Dependency check result: {stdout.strip() or 'No output'}"]
     if returncode != 0:
         messages.append(f"Error checking dependencies: {stderr}")
     return returncode == 0, messages
 
-def get_python_info(python_exe: str) -> Dict[str, str]:
+@functools.lru_cache(maxsize=None)
+def _site_dirs() -> List[str]:
+    """The running interpreter's site-packages directories, including the user site."""
+    import site
+    return getattr(site, 'getsitepackages', list)() + [site.getusersitepackages()]
+
+@functools.lru_cache(maxsize=None)
+def get_python_info(python_exe: str) -> Dict[str, Any]:
     """
     Get information about the specified Python environment.
-    Returns a dictionary with version and environment details.
+    Returns a dictionary with version and environment details, cached per interpreter
+    for the lifetime of the process (callers must not modify it). On Python 3.10+ it also
+    carries the interpreter's own 'stdlib_modules', which load_standard_library_modules
+    then prefers over the shipped lists for that version, and 'site_dirs', the
+    directories packages get installed into.
     """
+    if python_exe == sys.executable:
+        # The running interpreter can describe itself without a subprocess
+        info = {
+            "version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+            "environment": "virtual" if sys.prefix != sys.base_prefix else "global",
+            "prefix": sys.prefix,
+            "stdlib_modules": sorted(getattr(sys, 'stdlib_module_names', ())),
+            "site_dirs": _site_dirs()
+        }
+        _register_standard_library_modules(info["version"], info["stdlib_modules"])
+        return info
+    import subprocess
     try:
         process = subprocess.run(
-            [python_exe, '-c', 'import sys; print(sys.version.split()[0]); print(sys.prefix); print(sys.base_prefix)'],
+            [python_exe, '-c', _PYTHON_INFO_PROBE],
             capture_output=True,
-            text=True,
-            check=True,
-            encoding='utf-8', errors='ignore'
+            check=True
         )
-        output = process.stdout.strip().split('\n')
-        version = output[0]
-        prefix = output[1]
-        base_prefix = output[2]
-        is_venv = prefix != base_prefix
-        return {
-            "version": version,
+        probed = json.loads(process.stdout)
+        is_venv = probed['prefix'] != probed['base_prefix']
+        info = {
+            "version": probed['version'],
             "environment": "virtual" if is_venv else "global",
-            "prefix": prefix
+            "prefix": probed['prefix'],
+            "stdlib_modules": probed['stdlib_modules'],
+            "site_dirs": probed['site_dirs']
         }
+        _register_standard_library_modules(info["version"], info["stdlib_modules"])
+        return info
     except Exception as e:
         return {
             "version": "3.12",  # Default to 3.12 for standard library fallback
             "environment": "unknown",
-            "prefix": f"Error: {e}"
+            "prefix": f"Error: {e}",
+            "stdlib_modules": [],
+            "site_dirs": []
         }
-
-if __name__ == "__main__":
-    print("--- Testing dependency_core.py directly ---")
-    test_folder = os.path.join(os.getcwd(), "test_project_for_core")
-    python_exe = sys.executable
-
-    print(f"Scanning current directory: {test_folder} with Python: {python_exe}")
-
-    if not os.path.exists(test_folder):
-        os.makedirs(test_folder)
-    with open(os.path.join(test_folder, "script.py"), "w") as f:
-        f.write("import requests\nfrom bs4 import BeautifulSoup\nimport numpy\nimport os\n")
-    with open(os.path.join(test_folder, "requirements.txt"), "w") as f:
-        f.write("pandas\nscipy\n")
-
-    missing, scan_output = scan_dependencies_logic(test_folder, python_exe, recursive=True)
-    for msg in scan_output:
-        print(msg)
-
-    if missing:
-        print("\nAttempting to install missing dependencies...")
-        success, failed, install_output = install_dependencies_logic(missing, python_exe, verbose=True)
-        for msg in install_output:
-            print(msg)
-
-    print("\nGenerating requirements.txt...")
-    success, gen_output = generate_requirements_logic(test_folder, python_exe)
-    for msg in gen_output:
-        print(msg)
-
-    print("\nGenerating dependency tree...")
-    success, tree_output = dependency_tree_logic(python_exe, output_format="text")
-    for msg in tree_output:
-        print(msg)
\ No newline at end of file
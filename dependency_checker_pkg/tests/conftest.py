@@ -0,0 +1,6 @@
+import pytest
+
+@pytest.fixture(autouse=True)
+def _no_pip_upgrade(monkeypatch):
+    """Keep the bundled pip in virtual environments created by tests; upgrading it is slow and needs network."""
+    monkeypatch.setenv('DEPCHECK_SKIP_PIP_UPGRADE', '1')
@@ -1,67 +1,119 @@
 import pytest
 import os
 import sys
-import subprocess
 import json
+import logging
+import argparse
+import types
+import venv
+from pathlib import Path
 from unittest.mock import patch
 from dependency_cli import create_venv_if_needed, prompt_for_installation
-from dependency_core import load_package_map, load_standard_library_modules, PACKAGE_NAME_MAP
+import dependency_cli
+import dependency_core
+from dependency_cli import _cache_path, _cached, _load_python_info, _parse_args, _peek_command, _scan_with_cache
+from dependency_core import extract_imports_from_source, load_package_map, load_standard_library_modules, PACKAGE_NAME_MAP
+from dependency_core import _check_dependencies_in_process, _parse_batch_install_output, _parse_imports, _read_files_uring, _read_requirement_names, get_python_info
 
-@pytest.fixture
-def temp_project_dir(tmp_path):
-    """Create a temporary project directory for testing."""
-    project_dir = tmp_path / "project"
-    project_dir.mkdir()
-    return str(project_dir)
+# Shared by the prompt tests; prompt_for_installation only reads it
+_MISSING = {'requests': 'requirements.txt', 'bs4': 'script.py'}
 
-@pytest.fixture
-def custom_package_map(tmp_path):
-    """Create a temporary custom package map JSON file."""
-    map_file = tmp_path / "package_map.json"
-    custom_map = {"custom_module": "custom-package"}
-    with open(map_file, 'w', encoding='utf-8') as f:
-        json.dump(custom_map, f)
+@pytest.fixture(scope="session")
+def shared_venv_dir(tmp_path_factory):
+    """Create one real virtual environment, shared by the slow venv tests."""
+    project_dir = str(tmp_path_factory.mktemp("project"))
+    # Exercise the full path, including the pip upgrade that conftest.py turns off
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.delenv('DEPCHECK_SKIP_PIP_UPGRADE', raising=False)
+        success, _ = create_venv_if_needed(project_dir, sys.executable)
+    assert success is True
+    return project_dir
+
+@pytest.fixture(scope="session")
+def stdlib_3_12():
+    """The shipped Python 3.12 standard library list, read once per session."""
+    data = (Path(__file__).resolve().parent.parent / "data" / "stdlib_3_12.json").read_bytes()
+    try:
+        from orjson import loads
+    except ImportError:
+        loads = json.loads
+    return frozenset(loads(data))
+
+@pytest.fixture(scope="session")
+def custom_package_map(tmp_path_factory):
+    """Create a custom package map JSON file, shared by all tests (they only read it)."""
+    map_file = tmp_path_factory.mktemp("maps") / "package_map.json"
+    map_file.write_text(json.dumps({"custom_module": "custom-package"}), encoding='utf-8')
     return str(map_file)
 
-def test_create_venv_if_needed_new_venv(temp_project_dir):
+def _venv_python(venv_path):
+    """Expected interpreter path inside a virtual environment: Scripts\\python.exe on Windows, bin/python elsewhere."""
+    if sys.platform == 'win32':
+        return os.path.join(venv_path, 'Scripts', 'python.exe')
+    return os.path.join(venv_path, 'bin', 'python')
+
+def _fake_env_create(venv_path):
+    """Stand-in for EnvBuilder.create: lays out just the interpreter path."""
+    python_exe = _venv_python(venv_path)
+    os.makedirs(os.path.dirname(python_exe), exist_ok=True)
+    open(python_exe, 'w').close()
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="Python 3.8 creates the venv with venv.create")
+@patch('venv.EnvBuilder')
+def test_create_venv_if_needed_new_venv(mock_env_builder, tmp_path):
     """Test creating a new virtual environment."""
-    success, python_exe = create_venv_if_needed(temp_project_dir, sys.executable)
+    mock_env_builder.return_value.create.side_effect = _fake_env_create
+    success, python_exe = create_venv_if_needed(str(tmp_path), sys.executable)
+    venv_path = os.path.join(str(tmp_path), '.venv')
     assert success is True
     assert os.path.exists(python_exe)
-    assert os.path.exists(os.path.join(temp_project_dir, '.venv'))
-    # Verify pip is upgraded
-    result = subprocess.run([python_exe, '-m', 'pip', '--version'], capture_output=True, text=True)
-    assert result.returncode == 0
+    # conftest.py sets DEPCHECK_SKIP_PIP_UPGRADE
+    mock_env_builder.assert_called_once_with(with_pip=True, upgrade_deps=False)
+    mock_env_builder.return_value.create.assert_called_once_with(venv_path)
 
-def test_create_venv_if_needed_existing_venv(temp_project_dir):
+def test_create_venv_if_needed_existing_venv(tmp_path):
     """Test handling an existing virtual environment."""
-    # Create a virtual environment manually
-    venv_path = os.path.join(temp_project_dir, '.venv')
-    subprocess.run([sys.executable, '-m', 'venv', venv_path], check=True)
-    success, python_exe = create_venv_if_needed(temp_project_dir, sys.executable)
+    venv_path = os.path.join(str(tmp_path), '.venv')
+    # A real (pip-less) venv, built in-process rather than with 'python -m venv'
+    venv.EnvBuilder(with_pip=False, symlinks=(os.name != 'nt')).create(venv_path)
+    with patch('venv.EnvBuilder') as mock_env_builder:
+        success, python_exe = create_venv_if_needed(str(tmp_path), sys.executable)
     assert success is True
-    assert python_exe == os.path.join(venv_path, 'Scripts' if sys.platform == 'win32' else 'bin', 'python')
+    assert python_exe == _venv_python(venv_path)
+    assert os.path.exists(python_exe)
+    mock_env_builder.assert_not_called()
 
-@patch('builtins.input', side_effect=['all'])
-def test_prompt_for_installation_all(mock_input):
-    """Test interactive mode selecting all packages."""
-    missing_deps = {'requests': 'requirements.txt', 'bs4': 'script.py'}
-    selected = prompt_for_installation(missing_deps, PACKAGE_NAME_MAP)
-    assert set(selected) == {'requests', 'bs4'}
+@pytest.mark.slow
+@pytest.mark.xdist_group("venv")
+def test_create_venv_if_needed_real_venv(shared_venv_dir):
+    """Test creating (with the pip upgrade) and then reusing a real virtual environment (run with -m slow)."""
+    venv_path = os.path.join(shared_venv_dir, '.venv')
+    success, python_exe = create_venv_if_needed(shared_venv_dir, sys.executable)
+    assert success is True
+    assert python_exe == _venv_python(venv_path)
+    assert os.path.exists(python_exe)
 
-@patch('builtins.input', side_effect=['individual', 'y', 'n'])
-def test_prompt_for_installation_individual(mock_input):
-    """Test interactive mode selecting individual packages."""
-    missing_deps = {'requests': 'requirements.txt', 'bs4': 'script.py'}
-    selected = prompt_for_installation(missing_deps, PACKAGE_NAME_MAP)
-    assert selected == ['requests']
+@pytest.mark.parametrize("inputs,expected", [
+    (['all'], {'requests', 'bs4'}),
+    (['individual', 'y', 'n'], {'requests'}),
+    (['none'], set()),
+], ids=['all', 'individual', 'none'])
+def test_prompt_for_installation(inputs, expected, monkeypatch):
+    """Test interactive mode selecting all, individual or no packages."""
+    answers = iter(inputs)
+    monkeypatch.setattr('builtins.input', lambda _prompt='': next(answers))
+    selected = prompt_for_installation(_MISSING, PACKAGE_NAME_MAP)
+    assert set(selected) == expected
 
-@patch('builtins.input', side_effect=['none'])
-def test_prompt_for_installation_none(mock_input):
-    """Test interactive mode selecting no packages."""
-    missing_deps = {'requests': 'requirements.txt', 'bs4': 'script.py'}
+def test_prompt_for_installation_numbers(monkeypatch):
+    """Test interactive mode selecting packages by number in a single prompt."""
+    # A second prompt would raise StopIteration, so exhausting this means exactly one call
+    answers = iter(['2, 5'])
+    monkeypatch.setattr('builtins.input', lambda _prompt='': next(answers))
+    missing_deps = {'requests': 'requirements.txt', 'bs4': 'script.py', 'numpy': 'script.py'}
     selected = prompt_for_installation(missing_deps, PACKAGE_NAME_MAP)
-    assert selected == []
+    assert selected == ['bs4']
+    assert next(answers, None) is None
 
 def test_load_package_map_default():
     """Test loading default package map when no file is provided."""
@@ -75,12 +127,39 @@ def test_load_package_map_custom(custom_package_map):
     assert "custom_module" in package_map and package_map["custom_module"] == "custom-package"
     assert "bs4" in package_map and package_map["bs4"] == "beautifulsoup4"
 
+def test_load_package_map_cached(tmp_path):
+    """Test that an unchanged package map is served from the cache and a rewritten one is reloaded."""
+    map_file = tmp_path / "package_map.json"
+    map_file.write_text(json.dumps({"first_module": "first-package"}), encoding='utf-8')
+    first = load_package_map(str(map_file))
+    assert load_package_map(str(map_file)) is first
+
+    map_file.write_text(json.dumps({"second_module": "second-package"}), encoding='utf-8')
+    # Move the mtime forward explicitly; both writes can fall within the filesystem's timestamp granularity
+    st = os.stat(map_file)
+    os.utime(map_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = load_package_map(str(map_file))
+    assert second is not first
+    assert second["second_module"] == "second-package"
+    assert "first_module" not in second
+
 def test_load_package_map_invalid_file():
     """Test loading an invalid package map file."""
-    with patch('builtins.print') as mock_print:
-        package_map = load_package_map("nonexistent.json")
+    missing_file = FileNotFoundError(2, "No such file or directory", "nonexistent.json")
+    with patch('dependency_core.open', create=True, side_effect=missing_file):
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="Failed to load package map from nonexistent.json"):
+                package_map = load_package_map("nonexistent.json")
+            assert package_map == PACKAGE_NAME_MAP
+
+def test_load_package_map_malformed_file(tmp_path):
+    """Test that a malformed package map is reported on every load rather than cached."""
+    map_file = tmp_path / "package_map.json"
+    map_file.write_text("[1, 2]", encoding='utf-8')
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="must be a JSON object"):
+            package_map = load_package_map(str(map_file))
         assert package_map == PACKAGE_NAME_MAP
-        mock_print.assert_called_with("Warning: Failed to load package map from nonexistent.json: [Errno 2] No such file or directory: 'nonexistent.json'")
 
 def test_load_standard_library_modules_python_3_8():
     """Test loading standard library modules for Python 3.8."""
@@ -94,9 +173,407 @@ def test_load_standard_library_modules_python_3_11():
     assert "tomllib" in modules
     assert "zoneinfo" in modules
 
-def test_load_standard_library_modules_unknown_version():
+def test_load_standard_library_modules_unknown_version(stdlib_3_12):
     """Test loading standard library modules for an unknown Python version."""
-    with patch('builtins.print') as mock_print:
-        modules = load_standard_library_modules("3.7.0")
-        assert "tomllib" in modules  # Python 3.12 fallback
-        assert len(modules) == len(json.load(open("dependency_checker_pkg/data/stdlib_3_12.json")))
\ No newline at end of file
+    modules = load_standard_library_modules("3.7.0")
+    assert "tomllib" in modules  # Python 3.12 fallback
+    assert len(modules) == len(stdlib_3_12)
+
+def test_extract_imports_from_source_multiline():
+    """Test extracting imports spread over lines, comma lists and relative imports."""
+    source = b"from requests.adapters import (\n    HTTPAdapter,\n)\nimport yaml, numpy.linalg; import os\nfrom . import local\n"
+    assert extract_imports_from_source(source) == {"requests", "yaml", "numpy", "os"}
+
+def test_extract_imports_from_source_syntax_error():
+    """Test falling back to line matching for sources that don't parse."""
+    source = b"print 'python 2'\nimport requests\nfrom yaml import load\n"
+    assert extract_imports_from_source(source) == {"requests", "yaml"}
+
+@pytest.mark.parametrize("line,expected", [
+    ("requests>=2.0", ["requests"]),
+    ("requests[socks,security]==2.31", ["requests"]),
+    ("pkg @ https://example.com/pkg-1.0.tar.gz", ["pkg"]),
+    ("numpy  # pinned by the CI image", ["numpy"]),
+    ("-r other.txt", []),
+    ("--index-url https://example.com/simple", []),
+    ("-e .", []),
+    ("# just a comment", []),
+], ids=["specifier", "extras", "url", "inline-comment", "include", "option", "editable", "comment"])
+def test_read_requirement_names(line, expected, tmp_path):
+    """Test extracting package names from the different kinds of requirement lines."""
+    req_file = tmp_path / "requirements.txt"
+    req_file.write_text(line + "\n", encoding='utf-8')
+    assert _read_requirement_names(str(req_file)) == expected
+
+@pytest.mark.parametrize("python_version,expected", [
+    ("3.10.4", ["tomli", "requests"]),
+    ("3.11.7", ["requests"]),
+], ids=["3.10", "3.11"])
+def test_read_requirement_names_markers(python_version, expected, tmp_path):
+    """Test skipping requirements whose environment marker doesn't match the target interpreter."""
+    pytest.importorskip("packaging")
+    req_file = tmp_path / "requirements.txt"
+    req_file.write_text(
+        'pywin32; sys_platform == "win32"\n'
+        'tomli; python_version < "3.11"\n'
+        'requests ; python_version >= "3.8"\n',
+        encoding='utf-8'
+    )
+    platform_specific = ["pywin32"] if sys.platform == "win32" else []
+    assert _read_requirement_names(str(req_file), python_version) == platform_specific + expected
+
+@pytest.mark.parametrize("argv,expected", [
+    (["scan"], "scan"),
+    (["-r", "/tmp/proj", "scan", "--refresh"], "scan"),
+    (["--python", "python3", ".", "list", "--json"], "list"),
+    ([".", "install-pkg", "requests"], "install-pkg"),
+    (["/tmp/proj"], None),
+    (["tree", "list"], None),
+    (["-h", "scan"], None),
+    (["scan", "-h"], "scan"),
+], ids=["bare", "options-first", "python", "install-pkg", "missing", "ambiguous", "top-level-help", "command-help"])
+def test_peek_command(argv, expected):
+    """Test finding the command token without building the full parser."""
+    assert _peek_command(argv) == expected
+
+def test_parse_args_error_lists_all_commands(capsys):
+    """Test that a usage error on the single-command fast path reports every command."""
+    with pytest.raises(SystemExit) as excinfo:
+        _parse_args(["scan", "/tmp/proj"])
+    assert excinfo.value.code == 2
+    error = capsys.readouterr().err
+    assert error.count("invalid choice") == 1
+    assert "'install'" in error and "'generate-requirements'" in error
+
+@pytest.mark.parametrize("output,expected", [
+    ("Successfully installed a-1 b_c-2\n", (["a", "b-c"], [])),
+    ("Collecting x\nERROR: No matching distribution found for x\n", ([], ["x"])),
+    ("Successfully installed a-1.0 other-3.2\nERROR: No matching distribution found for B.C\n", (["a"], ["b-c"])),
+    ("ERROR: Could not install packages due to an OSError\n", ([], [])),
+], ids=["installed", "not-found", "mixed", "unattributed"])
+def test_parse_batch_install_output(output, expected):
+    """Test attributing a batch pip install's output to the requested packages."""
+    assert _parse_batch_install_output(output, ["a", "b-c", "x"]) == expected
+
+def _fake_distribution(name, version, requires=None):
+    """Stand-in for importlib.metadata.Distribution with the attributes the check reads."""
+    return types.SimpleNamespace(metadata={"Name": name}, version=version, requires=requires)
+
+@pytest.mark.parametrize("distributions,expected", [
+    ([_fake_distribution("app", "1.0", ["lib>=2.0"]), _fake_distribution("lib", "2.1")],
+     (0, "No broken requirements found.\n", "")),
+    ([_fake_distribution("app", "1.0", ["lib>=2.0"]), _fake_distribution("lib", "1.5")],
+     (1, "app 1.0 has requirement lib>=2.0, but you have lib 1.5.\n", "")),
+    ([_fake_distribution("app", "1.0", ["Missing_Lib"])],
+     (1, "app 1.0 requires missing-lib, which is not installed.\n", "")),
+    ([_fake_distribution("app", "1.0", ['winlib; sys_platform == "nonexistent"', 'extra-lib; extra == "dev"'])],
+     (0, "No broken requirements found.\n", "")),
+], ids=["satisfied", "unsatisfied", "missing", "markers"])
+def test_check_dependencies_in_process(distributions, expected, monkeypatch):
+    """Test the in-process equivalent of 'pip check' against a fake set of distributions."""
+    pytest.importorskip("packaging")
+    monkeypatch.setattr("importlib.metadata.distributions", lambda: distributions)
+    assert _check_dependencies_in_process() == expected
+
+def test_get_python_info_probes_each_interpreter_once(monkeypatch):
+    """Test that another interpreter is probed with a single subprocess per process lifetime."""
+    probed = []
+
+    def fake_run(cmd, **kwargs):
+        probed.append(cmd[0])
+        stdout = json.dumps({"version": "3.10.4", "prefix": "/opt/py", "base_prefix": "/opt/py",
+                             "stdlib_modules": [], "site_dirs": ["/opt/py/lib/python3.10/site-packages"]})
+        return types.SimpleNamespace(returncode=0, stdout=stdout.encode(), stderr=b"")
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    for _ in range(3):
+        assert get_python_info("/opt/fake-a/python")["version"] == "3.10.4"
+        assert get_python_info("/opt/fake-b/python")["site_dirs"] == ["/opt/py/lib/python3.10/site-packages"]
+    assert probed == ["/opt/fake-a/python", "/opt/fake-b/python"]
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    """Point the on-disk cache at an empty directory for this test."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    monkeypatch.setenv("LOCALAPPDATA", str(cache_home))
+    # Force the fallback in _cache_dir, which honours the variables above on every platform
+    monkeypatch.setitem(sys.modules, "platformdirs", None)
+    return cache_home
+
+@pytest.fixture
+def scan_env(tmp_path, cache_home, monkeypatch):
+    """A small project, a fake site-packages directory and a scan that counts its runs."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "app.py").write_text("import requests\n", encoding='utf-8')
+    site_dir = tmp_path / "site-packages"
+    site_dir.mkdir()
+    python_info = {"version": "3.11.7", "environment": "virtual", "prefix": str(tmp_path), "site_dirs": [str(site_dir)]}
+    monkeypatch.setattr(dependency_cli, "_load_python_info", lambda python_exe, use_cache=True: python_info)
+    scans = []
+
+    def fake_scan(path, python_exe, **kwargs):
+        scans.append(path)
+        return {"requests": "import in app.py"}, [f"scan {len(scans)}"]
+
+    monkeypatch.setattr(dependency_core, "scan_dependencies_logic", fake_scan)
+    return types.SimpleNamespace(project=project, site_dir=site_dir, scans=scans)
+
+def _scan_args(project, **overrides):
+    options = dict(path=str(project), recursive=True, jobs=1, io_uring=False, no_cache=False, refresh=False)
+    options.update(overrides)
+    return argparse.Namespace(**options)
+
+def _touch_later(path):
+    """Move a path's mtime forward; quick successive writes can share a timestamp."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+def _run_scan(scan_env, **overrides):
+    return _scan_with_cache(_scan_args(scan_env.project, **overrides), sys.executable, "3.11.7", PACKAGE_NAME_MAP)
+
+def test_scan_cache_hit(scan_env):
+    """Test that scanning an unchanged project reuses the stored result."""
+    first = _run_scan(scan_env)
+    second = _run_scan(scan_env)
+    assert len(scan_env.scans) == 1
+    assert tuple(second) == tuple(first)
+
+@pytest.mark.parametrize("change", ["edit", "add", "remove", "site-packages", "tool-version"])
+def test_scan_cache_invalidation(change, scan_env, monkeypatch):
+    """Test that anything the scan result depends on invalidates the stored result."""
+    _run_scan(scan_env)
+    if change == "edit":
+        app = scan_env.project / "app.py"
+        app.write_text("import requests, yaml\n", encoding='utf-8')
+        _touch_later(app)
+    elif change == "add":
+        (scan_env.project / "extra.py").write_text("import yaml\n", encoding='utf-8')
+    elif change == "remove":
+        (scan_env.project / "app.py").unlink()
+    elif change == "site-packages":
+        (scan_env.site_dir / "yaml").mkdir()
+        _touch_later(scan_env.site_dir)
+    else:
+        monkeypatch.setattr(dependency_cli, "_SCAN_CACHE_VERSION", dependency_cli._SCAN_CACHE_VERSION + 1)
+    _run_scan(scan_env)
+    assert len(scan_env.scans) == 2
+
+def test_scan_cache_bypass_flags(scan_env, cache_home):
+    """Test that --refresh rescans and rewrites the entry, and --no-cache neither reads nor writes it."""
+    _run_scan(scan_env)
+    _, messages = _run_scan(scan_env, refresh=True)
+    assert messages == ["scan 2"]
+    _, messages = _run_scan(scan_env)
+    assert messages == ["scan 2"]
+    assert len(scan_env.scans) == 2
+
+    entries = {p: p.read_bytes() for p in cache_home.rglob("scan-*.json")}
+    _, messages = _run_scan(scan_env, no_cache=True)
+    assert messages == ["scan 3"]
+    assert {p: p.read_bytes() for p in cache_home.rglob("scan-*.json")} == entries
+
+def _counting(value):
+    """A zero-argument function returning value and recording each call."""
+    calls = []
+
+    def fn():
+        calls.append(None)
+        return value
+    return fn, calls
+
+def test_cached_reuses_entry_until_ttl_expires(cache_home):
+    """Test that a stored value is returned until it is older than the TTL."""
+    fn, calls = _counting({"answer": 42})
+    assert _cached("unit", ["id", 1], 60, fn) == {"answer": 42}
+    assert _cached("unit", ["id", 1], 60, fn) == {"answer": 42}
+    assert len(calls) == 1
+
+    path = _cache_path("unit", "id")
+    entry = json.loads(Path(path).read_text(encoding='utf-8'))
+    entry['time'] -= 61
+    Path(path).write_text(json.dumps(entry), encoding='utf-8')
+    _cached("unit", ["id", 1], 60, fn)
+    assert len(calls) == 2
+
+def test_cached_key_mismatch_recomputes(cache_home):
+    """Test that a changed key (same identity) replaces the stored entry."""
+    fn, calls = _counting("value")
+    _cached("unit", ["id", 1], None, fn)
+    _cached("unit", ["id", 2], None, fn)
+    _cached("unit", ["id", 2], None, fn)
+    assert len(calls) == 2
+
+def test_cached_corrupt_file_recomputes(cache_home):
+    """Test that an unreadable cache file is ignored and overwritten."""
+    fn, calls = _counting("value")
+    path = Path(_cache_path("unit", "id"))
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding='utf-8')
+    assert _cached("unit", ["id", 1], None, fn) == "value"
+    assert json.loads(path.read_text(encoding='utf-8'))['value'] == "value"
+    assert len(calls) == 1
+
+@pytest.mark.parametrize("environment,probes", [("virtual", 1), ("unknown", 2)])
+def test_load_python_info_cache(environment, probes, cache_home, tmp_path, monkeypatch):
+    """Test that interpreter details are cached on disk, except for a failed probe."""
+    python_exe = tmp_path / "python"
+    python_exe.write_text("", encoding='utf-8')
+    calls = []
+
+    def fake_get_python_info(exe):
+        calls.append(exe)
+        return {"version": "3.10.4", "environment": environment, "prefix": "/opt/py", "stdlib_modules": [], "site_dirs": []}
+
+    monkeypatch.setattr(dependency_core, "get_python_info", fake_get_python_info)
+    for _ in range(2):
+        assert _load_python_info(str(python_exe))['environment'] == environment
+    assert len(calls) == probes
+    assert os.path.exists(_cache_path("python_info", str(python_exe))) == (environment != "unknown")
+
+def test_quiet_only_lasts_for_one_run(scan_env, monkeypatch, caplog):
+    """Test that --quiet silences this run's progress output without disabling logging for the process."""
+    caplog.set_level(logging.INFO)
+    for options, logged in ((["-q"], False), ([], True)):
+        caplog.clear()
+        monkeypatch.setattr(sys, "argv", ["dep-check", *options, "--python", sys.executable, str(scan_env.project), "scan"])
+        with pytest.raises(SystemExit):
+            dependency_cli.main()
+        assert ("Scanning dependencies" in caplog.text) == logged
+    assert logging.root.manager.disable == logging.NOTSET
+
+def test_list_json_keeps_stdout_for_the_document(scan_env, monkeypatch, capsys, caplog):
+    """Test that 'list --json' writes only JSON to stdout and sends log lines to stderr."""
+    packages = [{"name": "requests", "version": "2.31.0"}]
+    monkeypatch.setattr(dependency_core, "_list_installed_packages", lambda python_exe, outdated: (True, packages, []))
+    # The setup from the CLI's logging.basicConfig; pytest's own handlers make that call a no-op here
+    caplog.set_level(logging.INFO)
+    monkeypatch.setattr(logging.getLogger(), "handlers", [logging.StreamHandler(sys.stdout)])
+    with pytest.raises(SystemExit) as exc_info:
+        dependency_cli.main(["--python", sys.executable, str(scan_env.project), "list", "--json"])
+    assert exc_info.value.code == 0
+    captured = capsys.readouterr()
+    assert json.loads(captured.out) == packages
+    assert "Python Version: 3.11.7" in captured.err
+    assert logging.getLogger().handlers[0].stream is sys.stdout
+
+class _FakeCqe:
+    """A completion; like the liburing binding, reading a negative res raises OSError."""
+    def __init__(self, user_data, res):
+        self.user_data = user_data
+        self._res = res
+
+    @property
+    def res(self):
+        if self._res < 0:
+            raise OSError(-self._res, os.strerror(-self._res))
+        return self._res
+
+class _FakeUring:
+    """Stands in for the liburing module: operations run when submitted and their completions queue up."""
+    def __init__(self, fail_after_waits=None):
+        self.fail_after_waits = fail_after_waits
+        self.waits = 0
+        self.pending = []
+        self.completions = []
+        self.opened_fds = []
+        self.exited = False
+        self.Ring = object
+        self.Cqe = lambda: [None]
+
+    def io_uring_queue_init(self, entries, ring):
+        pass
+
+    def io_uring_get_sqe(self, ring):
+        sqe = types.SimpleNamespace(user_data=0, run=None)
+        self.pending.append(sqe)
+        return sqe
+
+    def io_uring_prep_open(self, sqe, path, flags):
+        def run():
+            fd = os.open(path, flags)
+            self.opened_fds.append(fd)
+            return fd
+        sqe.run = run
+
+    def io_uring_prep_read(self, sqe, fd, buffer, offset):
+        def run():
+            data = os.pread(fd, len(buffer), offset)
+            buffer[:len(data)] = data
+            return len(data)
+        sqe.run = run
+
+    def io_uring_prep_close(self, sqe, fd):
+        sqe.run = lambda: os.close(fd) or 0
+
+    def io_uring_submit(self, ring):
+        for sqe in self.pending:
+            try:
+                res = sqe.run()
+            except OSError as e:
+                res = -e.errno
+            self.completions.append(_FakeCqe(sqe.user_data, res))
+        self.pending = []
+
+    def io_uring_wait_cqe(self, ring, cqe):
+        self.waits += 1
+        if self.fail_after_waits is not None and self.waits > self.fail_after_waits:
+            raise OSError("ring failure")
+        cqe[0] = self.completions.pop(0)
+
+    def io_uring_cqe_seen(self, ring, entry):
+        pass
+
+    def io_uring_queue_exit(self, ring):
+        self.exited = True
+
+def _is_open(fd):
+    try:
+        os.fstat(fd)
+    except OSError:
+        return False
+    return True
+
+@pytest.fixture
+def source_files(tmp_path):
+    """Source files for the io_uring tests; one is larger than the io_uring read buffer."""
+    paths = []
+    for index, module in enumerate(["requests", "numpy", "yaml"]):
+        path = tmp_path / f"module_{index}.py"
+        path.write_text(f"import {module}\n" + ("# padding\n" * 10_000 if module == "numpy" else ""), encoding='utf-8')
+        paths.append(str(path))
+    return paths
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="io_uring is Linux only")
+def test_read_files_uring_reads_whole_files(source_files, tmp_path, monkeypatch):
+    """Test that io_uring reads return each file in full, skip files that can't be opened and close every descriptor."""
+    uring = _FakeUring()
+    monkeypatch.setitem(sys.modules, "liburing", uring)
+    missing = str(tmp_path / "missing.py")
+    contents = _read_files_uring(source_files + [missing])
+    assert contents == {path: Path(path).read_bytes() for path in source_files}
+    assert len(uring.opened_fds) == len(source_files)
+    assert not any(_is_open(fd) for fd in uring.opened_fds)
+    assert uring.exited
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="io_uring is Linux only")
+def test_parse_imports_falls_back_without_liburing(source_files, monkeypatch):
+    """Test that import parsing reads the files normally when the liburing binding is missing."""
+    monkeypatch.setitem(sys.modules, "liburing", None)
+    assert _read_files_uring(source_files) is None
+    assert _parse_imports(source_files, use_io_uring=True) == _parse_imports(source_files)
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="io_uring is Linux only")
+def test_read_files_uring_failure_mid_batch_closes_opened_files(source_files, monkeypatch):
+    """Test that a failure while reaping the opens closes the descriptors already reaped."""
+    uring = _FakeUring(fail_after_waits=2)
+    monkeypatch.setitem(sys.modules, "liburing", uring)
+    contents = _read_files_uring(source_files)
+    reaped, unreaped = uring.opened_fds[:2], uring.opened_fds[2:]
+    # The open whose completion was never reaped; a real ring would still hold it too
+    for fd in unreaped:
+        os.close(fd)
+    assert contents == {}
+    assert not any(_is_open(fd) for fd in reaped)
+    assert uring.exited